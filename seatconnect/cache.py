@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""On-disk cache of vehicle discovery results."""
+import os
+import json
+import time
+import logging
+import asyncio
+
+from datetime import date, datetime
+from seatconnect.utilities import json_loads
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _serialize(obj):
+    """Serialize datetime objects in the format json_loads parses back to datetime."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+class DiscoveryCache:
+    """JSON file with discovery results per VIN.
+
+    Entries are {'discovered': epoch, 'apibase', 'secbase', 'services', 'modelimagel', 'modelimages', 'realcar'}.
+    The file is read once. Changes are written write_delay seconds after the first change, so discoveries
+    of many vehicles are written together, flush() writes pending changes at once and is called by Connection.close()
+and Fleet.stop(). Writes replace the file atomically so a crash never leaves a partial file.
+    """
+
+    def __init__(self, path, write_delay=5):
+        self._path = os.path.expanduser(path)
+        self._write_delay = write_delay
+        self._data = None
+        # Entries encoded as JSON when stored, the file is joined from these without encoding all entries again
+        self._encoded = {}
+        self._dirty = False
+        self._flush_task = None
+        self._lock = asyncio.Lock()
+
+    def _load(self):
+        if self._data is None:
+            try:
+                with open(self._path, encoding='utf-8') as cachefile:
+                    self._data = json_loads(cachefile.read())
+                if not isinstance(self._data, dict):
+                    raise ValueError('Unexpected cache content')
+            except FileNotFoundError:
+                self._data = {}
+            except (OSError, ValueError) as error:
+                _LOGGER.warning(f'Could not read discovery cache {self._path}, error: {error}')
+                self._data = {}
+            self._encoded = {vin: json.dumps(entry, default=_serialize) for vin, entry in self._data.items()}
+        return self._data
+
+    def _write(self, encoded):
+        content = '{' + ', '.join(f'{json.dumps(vin)}: {entry}' for vin, entry in encoded) + '}'
+        tmpfile = f'{self._path}.tmp'
+        with open(tmpfile, 'w', encoding='utf-8') as cachefile:
+            cachefile.write(content)
+        os.replace(tmpfile, self._path)
+
+    def _changed(self):
+        self._dirty = True
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.ensure_future(self._delayed_flush())
+
+    async def _delayed_flush(self):
+        # Changes made while writing are written after another delay
+        while self._dirty:
+            await asyncio.sleep(self._write_delay)
+            await self.flush()
+
+    async def flush(self):
+        """Write pending changes to cache file now."""
+        async with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, self._write, list(self._encoded.items()))
+            except OSError as error:
+                _LOGGER.warning(f'Could not write discovery cache {self._path}, error: {error}')
+
+    def get(self, vin):
+        """Return cached discovery entry for VIN, or None."""
+        return self._load().get(vin, None)
+
+    async def set(self, vin, entry):
+        """Store discovery entry for VIN, cache file is written after write_delay seconds."""
+        data = self._load()
+        data[vin] = dict(entry, discovered=time.time())
+        try:
+            self._encoded[vin] = json.dumps(data[vin], default=_serialize)
+        except TypeError as error:
+            _LOGGER.warning(f'Could not store discovery of {vin} in cache, error: {error}')
+            return
+        self._changed()
+
+    def remove(self, vin):
+        """Forget cached entry for VIN, cache file is written after write_delay seconds."""
+        self._load().pop(vin, None)
+        if self._encoded.pop(vin, None) is not None:
+            self._changed()
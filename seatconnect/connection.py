@@ -12,19 +12,26 @@ import jwt
 import hmac
 import string
 import secrets
+import json
+import random
+import inspect
 import xmltodict
 
 from sys import version_info, argv
 from datetime import timedelta, datetime, timezone
 from urllib.parse import urljoin, parse_qs, urlparse, urlencode
+from email.utils import parsedate_to_datetime
 from json import dumps as to_json
 from jwt.exceptions import ExpiredSignatureError
 import aiohttp
-from bs4 import BeautifulSoup
+from yarl import URL
 from base64 import b64decode, b64encode
 from seatconnect.__version__ import __version__ as lib_version
-from seatconnect.utilities import read_config, json_loads
+from seatconnect.utilities import read_config, json_loads, XMLExtractor, update_fields, html_parse, html_form, html_inline_scripts
 from seatconnect.vehicle import Vehicle
+from seatconnect.ratelimit import RateLimiter, vin_from_url
+from seatconnect.cache import DiscoveryCache
+from seatconnect.tracker import RequestTracker
 from seatconnect.exceptions import (
     SeatConfigException,
     SeatAuthenticationException,
@@ -61,7 +68,12 @@ from .const import (
     MODELAPPID,
     MODELAPIKEY,
     MODELHOST,
-    MODELAPI
+    MODELAPI,
+    JWKS_TTL,
+    POLL_INTERVALS,
+    MAX_STALENESS,
+    AUTH_TOKENKEYS,
+    AUTH_VWGKEYS
 )
 
 version_info >= (3, 0) or exit('Python 3 required')
@@ -69,16 +81,50 @@ version_info >= (3, 0) or exit('Python 3 required')
 _LOGGER = logging.getLogger(__name__)
 
 TIMEOUT = timedelta(seconds=30)
+CONCURRENCY = 4
+REQUEST_CONCURRENCY = 10
+
+# Vehicle specification from vehicleDataDetail carportData, {specification key: XML element}
+CARPORT_FIELDS = {
+    'modelCode': 'modelCode',
+    'title': 'modelName',
+    'manufacturingDate': 'modelYear',
+    'color': 'color',
+    'countryCode': 'countryCode',
+    'engine': 'engine',
+    'mmi': 'mmi',
+    'transmission': 'transmission',
+}
+
+# Embedded JSON model in login page script
+TEMPLATE_MODEL = re.compile('templateModel: (.*?),\n')
+
+# Cookies from these domains are persisted with the session
+SESSION_COOKIE_DOMAINS = ('vwgroup.io', 'vwg-connect.com', 'vwapps.io')
+
+# Token signing keys, shared between all Connection objects in process
+# {url: {'keys': {kid: public key}, 'expires': datetime, 'fetch': future of key set request in progress}}
+JWKS_CACHE = {}
 
 class Connection:
     """ Connection to Connect services """
   # Init connection class
     def __init__(self, session, username, password, fulldebug=False, **optional):
         """ Initialize """
-        self._session = session
+        # Cookies of this account are kept in a jar of its own, requests use the connection pool of session
+        self._session = ClientSession(
+            connector=session.connector,
+            connector_owner=False,
+            cookie_jar=aiohttp.CookieJar(),
+            headers=session.headers,
+            timeout=session.timeout,
+            trust_env=session.trust_env
+        )
         self._lock = asyncio.Lock()
         self._session_fulldebug = fulldebug
-        self._session_headers = HEADERS_SESSION.copy()
+        # Base headers for API requests, never modified. Per request headers are passed to _request.
+        # Content-Type is set per request, aiohttp sets it for JSON payloads.
+        self._session_headers = {key: value for key, value in HEADERS_SESSION.items() if key != 'Content-Type'}
         self._session_base = BASE_SESSION
         self._session_auth_headers = HEADERS_AUTH.copy()
         self._session_cookies = ""
@@ -91,15 +137,62 @@ class Connection:
         self._session_auth_username = username
         self._session_auth_password = password
         self._session_tokens = {}
+        self._session_claims = {}
+        # Validators and parsed responses for conditional GET requests, {url: {'etag', 'last_modified', 'response'}}
+        # Response is None for requests made with keep_response=False
+        self._session_validators = {}
+
+        # Client side rate limiting, configure with rate_limit={...} or disable with rate_limit=False
+        rate_limit = optional.get('rate_limit', {})
+        self._ratelimiter = RateLimiter(**rate_limit) if rate_limit is not False else None
+        # Max number of vehicles fetched or updated concurrently, and of concurrent API requests
+        self._session_concurrency = optional.get('concurrency', CONCURRENCY)
+        self._request_semaphore = asyncio.Semaphore(optional.get('request_concurrency', REQUEST_CONCURRENCY))
+        # Vehicle updates in update_all are started after a random delay of up to jitter seconds
+        self._update_jitter = optional.get('jitter', 0)
+        # Vehicle discovery results are persisted to discovery_cache (path to JSON file or shared DiscoveryCache) if set
+        discovery_cache = optional.get('discovery_cache', None)
+        if isinstance(discovery_cache, DiscoveryCache) or not discovery_cache:
+            self._discovery_cache = discovery_cache
+        else:
+            self._discovery_cache = DiscoveryCache(discovery_cache)
+        # Model image URLs by VIN and size, pass the same dict to share it between connections
+        self._model_images = optional.get('model_image_cache', {})
+        # Tokens and cookies are persisted to token_store (TokenStore instance) if set
+        self._token_store = optional.get('token_store', None)
+        # Status of outstanding action requests is polled by one tracker, configure with request_tracker={...}
+        self._request_tracker = RequestTracker(self.get_request_status, **optional.get('request_tracker', {}))
+        # Only decoded values of charger, climater, heater and position data are kept if compact_state is set
+        self._compact_state = optional.get('compact_state', False)
+        # Endpoints are fetched by state dependent intervals if poll_intervals is set, True for defaults or
+        # {endpoint: {state: seconds}} to override defaults. All endpoints are fetched on every update if not set.
+        poll_intervals = optional.get('poll_intervals', None)
+        if poll_intervals:
+            overrides = poll_intervals if isinstance(poll_intervals, dict) else {}
+            self._poll_intervals = {
+                endpoint: dict(intervals, **overrides.get(endpoint, {}))
+                for endpoint, intervals in POLL_INTERVALS.items()
+            }
+        else:
+            self._poll_intervals = None
+        # With status_first the status report is fetched before other endpoints, these are only fetched if
+        # the car has sent data since last update (tsCarSentUtc) or their data is older than max_staleness seconds
+        self._status_first = optional.get('status_first', False)
+        self._max_staleness = optional.get('max_staleness', MAX_STALENESS)
 
         self._vehicles = []
+        # Account profile data shared by all vehicles, fetched once per refresh cycle
+        self._realcars = None
+        # realCars payload and the VIN index built from it, index is kept while the payload is unchanged
+        self._realcars_payload = None
+        self._realcars_index = None
 
         _LOGGER.info(f'Init Seat Connect library, version {lib_version}')
         _LOGGER.debug(f'Using service {self._session_base}')
 
 
     def _clear_cookies(self):
-        self._session._cookie_jar._cookies.clear()
+        self._session.cookie_jar.clear()
         self._session_cookies = ''
 
     def _getNonce(self):
@@ -115,6 +208,11 @@ class Connection:
   # API login/logout/authorization
     async def doLogin(self):
         """Login method, clean login"""
+        # Resume stored session if available, refresh is much cheaper than a new login
+        if not self._session_tokens and self._token_store is not None:
+            if await self._restoreSession():
+                return True
+
         _LOGGER.info('Initiating new login')
 
         if len(self._session_tokens) > 0:
@@ -128,13 +226,58 @@ class Connection:
         self._clear_cookies()
         self._vehicles.clear()
         self._session_tokens = {}
-        self._session_headers = HEADERS_SESSION.copy()
         self._session_auth_headers = HEADERS_AUTH.copy()
         self._session_nonce = self._getNonce()
         self._session_state = self._getState()
 
         # Login with Seat client
-        return await self._authorize(BRAND)
+        result = await self._authorize(BRAND)
+        if result is True:
+            await self._saveSession()
+        return result
+
+    async def _restoreSession(self):
+        """Restore tokens and cookies from token store, refresh expired tokens. Return True if session is usable."""
+        try:
+            data = await self._token_store.load(self._session_auth_username)
+        except Exception as error:
+            _LOGGER.warning(f'Could not load session from token store, error: {error}')
+            return False
+        if not data or not data.get('tokens', {}).get(BRAND, None):
+            _LOGGER.debug('No stored session found')
+            return False
+
+        self._session_tokens = {client: dict(tokens) for client, tokens in data.get('tokens', {}).items()}
+        for cookie in data.get('cookies', []):
+            if cookie.get('domain', False):
+                self._session.cookie_jar.update_cookies(
+                    {cookie['key']: cookie['value']},
+                    response_url=URL(f'https://{cookie["domain"].lstrip(".")}{cookie.get("path", "/")}')
+                )
+        try:
+            for client in [client for client in (BRAND, 'vwg') if client in self._session_tokens]:
+                await self.set_token(client)
+        except Exception as error:
+            _LOGGER.info(f'Stored session could not be refreshed, new login needed. Error: {error}')
+            self._session_tokens = {}
+            self._clear_cookies()
+            return False
+        _LOGGER.info('Resumed stored session')
+        return True
+
+    async def _saveSession(self):
+        """Save tokens and cookies to token store."""
+        if self._token_store is None:
+            return
+        cookies = [
+            {'key': cookie.key, 'value': cookie.value, 'domain': cookie['domain'], 'path': cookie['path'] or '/'}
+            for cookie in self._session.cookie_jar
+            if cookie['domain'].endswith(SESSION_COOKIE_DOMAINS)
+        ]
+        try:
+            await self._token_store.save(self._session_auth_username, {'tokens': self._session_tokens, 'cookies': cookies})
+        except Exception as error:
+            _LOGGER.warning(f'Could not save session to token store, error: {error}')
 
     async def _authorize(self, client=BRAND):
         """"Login" function. Authorize a certain client type and get tokens."""
@@ -147,7 +290,6 @@ class Connection:
 
         # Login/Authorization starts here
         try:
-            self._session_headers = HEADERS_SESSION.copy()
             self._session_auth_headers = HEADERS_AUTH.copy()
 
             _LOGGER.debug(f'Starting authorization process for client {client}')
@@ -324,16 +466,15 @@ class Connection:
         # Extract login form and extract attributes
         try:
             response_data = await html.text()
-            responseSoup = BeautifulSoup(response_data, 'html.parser')
-            form_data = dict()
-            if responseSoup is None:
+            email_form = html_form(html_parse(response_data), 'emailPasswordForm')
+            if email_form is None:
                 raise SeatLoginFailedException('Login failed, server did not return a login form')
-            for t in responseSoup.find('form', id='emailPasswordForm').find_all('input', type='hidden'):
-                if self._session_fulldebug:
-                    _LOGGER.debug(f'Extracted form attribute: {t["name"], t["value"]}')
-                form_data[t['name']] = t['value']
+            action, form_data = email_form
+            if self._session_fulldebug:
+                for name, value in form_data.items():
+                    _LOGGER.debug(f'Extracted form attribute: {name, value}')
             form_data['email'] = self._session_auth_username
-            pe_url = authissuer+responseSoup.find('form', id='emailPasswordForm').get('action')
+            pe_url = authissuer+action
         except Exception as e:
             _LOGGER.error('Failed to extract user login form.')
             raise
@@ -352,25 +493,22 @@ class Connection:
             raise SeatException('Authorization request failed')
         try:
             response_data = await req.text()
-            responseSoup = BeautifulSoup(response_data, 'html.parser')
-            pwform = {}
-            credentials_form = responseSoup.find('form', id='credentialsForm')
-            all_scripts = responseSoup.find_all('script', {'src': False})
+            document = html_parse(response_data)
+            credentials_form = html_form(document, 'credentialsForm')
+            all_scripts = html_inline_scripts(document)
             if credentials_form is not None:
                 _LOGGER.debug('Found HTML credentials form, extracting attributes')
-                for t in credentials_form.find_all('input', type='hidden'):
-                    if self._session_fulldebug:
-                        _LOGGER.debug(f'Extracted form attribute: {t["name"], t["value"]}')
-                    pwform[t['name']] = t['value']
+                post_action, pwform = credentials_form
+                if self._session_fulldebug:
+                    for name, value in pwform.items():
+                        _LOGGER.debug(f'Extracted form attribute: {name, value}')
+                if pwform:
                     form_data = pwform
-                    post_action = responseSoup.find('form', id='credentialsForm').get('action')
             elif all_scripts is not None:
                 _LOGGER.debug('Found dynamic credentials form, extracting attributes')
-                pattern = re.compile("templateModel: (.*?),\n")
                 for sc in all_scripts:
-                    if(pattern.search(sc.string)):
-                        import json
-                        data = pattern.search(sc.string)
+                    data = TEMPLATE_MODEL.search(sc)
+                    if data:
                         jsondata = json.loads(data.groups()[0])
                         _LOGGER.debug(f'JSON: {jsondata}')
                         if not jsondata.get('hmac', False):
@@ -467,9 +605,6 @@ class Connection:
                     _LOGGER.warning('VW-Group API token could not be verified!')
                 else:
                     _LOGGER.debug('VW-Group API token verified OK.')
-
-            # Update headers for requests, defaults to using VWG token
-            self._session_headers['Authorization'] = 'Bearer ' + self._session_tokens['vwg']['access_token']
         #except Exception as error:
         #    _LOGGER.error(f'Failed to fetch VW-Group API tokens, {error}')
         #    return False
@@ -478,15 +613,21 @@ class Connection:
         return True
 
     async def terminate(self):
-        """Log out from connect services"""
+        """Log out from connect services and close connection"""
         _LOGGER.info(f'Initiating logout')
         await self.logout()
+        await self.close()
+
+    async def close(self):
+        """Write pending discovery cache changes and close HTTP session of connection, the connection pool
+        of the session passed in is left open. The connection can not be used after close."""
+        if self._discovery_cache is not None:
+            await self._discovery_cache.flush()
+        await self._session.close()
 
     async def logout(self):
         """Logout, revoke tokens."""
-        self._session_headers.pop('Authorization', None)
-        self._session_headers.pop('tokentype', None)
-        self._session_headers['Content-Type'] = 'application/x-www-form-urlencoded'
+        headers = {'Content-Type': 'application/x-www-form-urlencoded'}
 
         for client in self._session_tokens:
             # Ignore identity tokens
@@ -515,7 +656,7 @@ class Connection:
                 # Revoke tokens
                 else:
                     try:
-                        if await self.post(revoke_url, data = params):
+                        if await self.post(revoke_url, headers=headers, client=None, data = params):
                             _LOGGER.info(f'Revocation of "{token_type}" for client "{client}" successful')
                             # Remove token info
                             self._session_tokens[client][token_type] = None
@@ -525,11 +666,22 @@ class Connection:
                         _LOGGER.info(f'Revocation failed with error: {e}')
                         pass
 
+        # Revoked tokens can't be resumed
+        if self._token_store is not None:
+            try:
+                await self._token_store.clear(self._session_auth_username)
+            except Exception as error:
+                _LOGGER.warning(f'Could not clear token store, error: {error}')
+
   # HTTP methods to API
-    async def get(self, url, vin=''):
-        """Perform a HTTP GET."""
+    async def get(self, url, vin='', headers=None, client='vwg', conditional=False, fields=None, keep_response=True):
+        """Perform a HTTP GET. If conditional, reuse previous response if server reports it unchanged.
+        Without keep_response only validators are kept and an unchanged response returns {'status_code': 304}.
+        For XML responses, fields limits the response to the text of the given elements."""
         try:
-            response = await self._request(METH_GET, url)
+            response = await self._request(
+                METH_GET, url, headers=headers, client=client, conditional=conditional, fields=fields, keep_response=keep_response
+            )
             return response
         except aiohttp.client_exceptions.ClientResponseError as error:
             data = {
@@ -560,26 +712,51 @@ class Connection:
         except Exception as e:
             _LOGGER.debug(f'Got non HTTP related error: {e}')
 
-    async def post(self, url, **data):
+    async def post(self, url, headers=None, client='vwg', **data):
         """Perform a HTTP POST."""
         if data:
-            return await self._request(METH_POST, url, **data)
+            return await self._request(METH_POST, url, headers=headers, client=client, **data)
         else:
-            return await self._request(METH_POST, url)
-
-    async def _request(self, method, url, **kwargs):
+            return await self._request(METH_POST, url, headers=headers, client=client)
+
+    def _request_headers(self, client='vwg', headers=None):
+        """Build headers for a single request: base headers, authorization for client and overrides.
+        Overrides with value None remove the header."""
+        request_headers = dict(self._session_headers)
+        if client is not None:
+            request_headers.update(self._auth_headers(client))
+        if headers:
+            request_headers.update(headers)
+        return {key: value for key, value in request_headers.items() if value is not None}
+
+    async def _request(self, method, url, headers=None, client='vwg', conditional=False, fields=None, keep_response=True, **kwargs):
         """Perform a HTTP query"""
         if self._session_fulldebug:
             _LOGGER.debug(f'HTTP {method} "{url}"')
-        async with self._session.request(
+        # Send validators from previous response for conditional requests
+        cached = self._session_validators.get(url, None) if conditional else None
+        if cached is not None:
+            headers = dict(headers or {})
+            if cached.get('etag', None):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified', None):
+                headers['If-Modified-Since'] = cached['last_modified']
+        vin = vin_from_url(url)
+        if self._ratelimiter is not None:
+            await self._ratelimiter.acquire(vin, action=(method == METH_POST and vin is not None))
+        # Requests wait for a free slot after rate limiting, a throttled request does not hold a slot
+        async with self._request_semaphore, self._session.request(
             method,
             url,
-            headers=self._session_headers,
+            headers=self._request_headers(client, headers),
             timeout=ClientTimeout(total=TIMEOUT.seconds),
             cookies=self._session_cookies,
             raise_for_status=False,
             **kwargs
         ) as response:
+            # Backend throttled us, empty VIN bucket so further actions are held back
+            if response.status == 429 and self._ratelimiter is not None:
+                self._ratelimiter.update(vin, response.headers.get('X-RateLimit-Remaining', 0))
             response.raise_for_status()
 
             # Update cookie jar
@@ -588,6 +765,13 @@ class Connection:
             else:
                 self._session_cookies = response.cookies
 
+            # Response is unchanged since last request, reuse previously parsed response
+            if response.status == 304 and cached is not None:
+                _LOGGER.debug(f'Request for "{url}" returned with status code [304], response unchanged')
+                if cached['response'] is None:
+                    return {'status_code': response.status}
+                return cached['response']
+
             try:
                 if response.status == 204:
                     res = {'status_code': response.status}
@@ -599,7 +783,14 @@ class Connection:
                         else:
                             return False
                     else:
-                        if 'xml' in response.headers.get('Content-Type', ''):
+                        if 'xml' in response.headers.get('Content-Type', '') and fields is not None:
+                            # Stop reading the response once all fields are found
+                            extractor = XMLExtractor(fields)
+                            async for chunk in response.content.iter_chunked(4096):
+                                if extractor.feed(chunk):
+                                    break
+                            res = extractor.found
+                        elif 'xml' in response.headers.get('Content-Type', ''):
                             res = xmltodict.parse(await response.text())
                         else:
                             res = await response.json(loads=json_loads)
@@ -608,25 +799,38 @@ class Connection:
                     _LOGGER.debug(f'Not success status code [{response.status}] response: {response}')
                 if 'X-RateLimit-Remaining' in response.headers:
                     res['rate_limit_remaining'] = response.headers.get('X-RateLimit-Remaining', '')
+                    if self._ratelimiter is not None:
+                        self._ratelimiter.update(vin, res['rate_limit_remaining'])
             except Exception as e:
                 res = {}
                 _LOGGER.debug(f'Something went wrong [{response.status}] response: {response}, error: {e}')
                 return res
 
+            # Remember validators for next conditional request
+            if conditional and response.status == 200:
+                if response.headers.get('ETag', False) or response.headers.get('Last-Modified', False):
+                    self._session_validators[url] = {
+                        'etag': response.headers.get('ETag', None),
+                        'last_modified': response.headers.get('Last-Modified', None),
+                        'response': res if keep_response else None
+                    }
+                else:
+                    self._session_validators.pop(url, None)
+
             if self._session_fulldebug:
                 _LOGGER.debug(f'Request for "{url}" returned with status code [{response.status}], response: {res}')
             else:
                 _LOGGER.debug(f'Request for "{url}" returned with status code [{response.status}]')
             return res
 
-    async def _data_call(self, query, **data):
+    async def _data_call(self, query, headers=None, **data):
         """Function for POST actions with error handling."""
         try:
-            response = await self.post(query, **data)
+            response = await self.post(query, headers=headers, **data)
             _LOGGER.debug(f'Data call returned: {response}')
             return response
         except aiohttp.client_exceptions.ClientResponseError as error:
-            _LOGGER.debug(f'Request failed. Data: {data}, HTTP request headers: {self._session_headers}')
+            _LOGGER.debug(f'Request failed. Data: {data}, HTTP request headers: {self._request_headers("vwg", headers)}')
             if error.status == 401:
                 _LOGGER.error('Unauthorized')
             elif error.status == 400:
@@ -646,25 +850,33 @@ class Connection:
         return False
 
   # Class get data functions
-    async def update_all(self):
-        """Update status."""
+    async def prepare_update(self):
+        """Start new refresh cycle, validate API token and fetch account profile data again when needed."""
+        await self.set_token('vwg')
+        self._realcars = None
+
+    async def update_all(self, progress=None):
+        """Update status.
+        progress(vehicle, result, done, total) is called, or awaited, as each vehicle update completes."""
         try:
-            await self.set_token('vwg')
-            # Get all Vehicle objects and update in parallell
-            update_list = []
-            for vehicle in self.vehicles:
-                if vehicle.vin not in update_list:
-                    _LOGGER.debug(f'Adding {vehicle.vin} for data refresh')
-                    update_list.append(vehicle.update())
-                else:
-                    _LOGGER.debug(f'VIN {vehicle.vin} is already queued for data refresh')
+            await self.prepare_update()
+            # Get all Vehicle objects and update in parallell, at most concurrency vehicles at a time
+            update_list = self._update_list()
 
             # Wait for all data updates to complete
             if len(update_list) == 0:
                 _LOGGER.info('No vehicles in account to update')
             else:
                 _LOGGER.debug('Calling update function for all vehicles')
-                await asyncio.gather(*update_list)
+                semaphore = asyncio.Semaphore(self._session_concurrency)
+                done = []
+                results = await asyncio.gather(
+                    *[self._updateVehicle(vehicle, semaphore, progress, done, len(update_list)) for vehicle in update_list.values()]
+                )
+                # All vehicles are updated even if one fails
+                for _, result in results:
+                    if isinstance(result, Exception):
+                        raise result
             return True
         except (IOError, OSError, LookupError, Exception) as error:
             _LOGGER.warning(f'An error was encountered during interaction with the API: {error}')
@@ -672,8 +884,57 @@ class Connection:
             raise
         return False
 
-    async def get_vehicles(self):
-        """Fetch vehicle information from user profile."""
+    async def iter_updates(self):
+        """Update all vehicles, yield (vehicle, result) as each update completes.
+        result is {'result': return value of vehicle.update() or the exception raised, 'endpoints': vehicle.endpoint_results}."""
+        await self.prepare_update()
+        update_list = self._update_list()
+        semaphore = asyncio.Semaphore(self._session_concurrency)
+        done = []
+        tasks = [
+            asyncio.ensure_future(self._updateVehicle(vehicle, semaphore, None, done, len(update_list)))
+            for vehicle in update_list.values()
+        ]
+        try:
+            for task in asyncio.as_completed(tasks):
+                vehicle, result = await task
+                yield vehicle, {'result': result, 'endpoints': vehicle.endpoint_results}
+        finally:
+            # Consumer stopped iterating, do not leave updates running
+            for task in tasks:
+                task.cancel()
+
+    def _update_list(self):
+        """Return vehicles to update by VIN."""
+        update_list = {}
+        for vehicle in self.vehicles:
+            if vehicle.vin not in update_list:
+                _LOGGER.debug(f'Adding {vehicle.vin} for data refresh')
+                update_list[vehicle.vin] = vehicle
+            else:
+                _LOGGER.debug(f'VIN {vehicle.vin} is already queued for data refresh')
+        return update_list
+
+    async def _updateVehicle(self, vehicle, semaphore, progress, done, total):
+        """Update vehicle after a random delay when a slot is free, report progress when done.
+        Returns vehicle and result of update, or the exception raised by it."""
+        if self._update_jitter:
+            await asyncio.sleep(random.uniform(0, self._update_jitter))
+        async with semaphore:
+            try:
+                result = await vehicle.update()
+            except Exception as error:
+                result = error
+        done.append(vehicle.vin)
+        _LOGGER.debug(f'Updated {vehicle.vin}, {len(done)} of {total} vehicles done')
+        if progress is not None:
+            callback = progress(vehicle, result, len(done), total)
+            if inspect.isawaitable(callback):
+                await callback
+        return vehicle, result
+
+    async def get_vehicles(self, update=True):
+        """Fetch vehicle information from user profile, and update all vehicles unless update is False."""
         api_vehicles = []
         # Check if user needs to update consent
         try:
@@ -696,58 +957,28 @@ class Connection:
         # Fetch vehicles
         try:
             await self.set_token('vwg')
-            self._session_headers.pop('Content-Type', None)
             # Extract MBB User ID (Subject) from token
-            subject = None
-            atoken = self._session_tokens['vwg'].get('access_token', None)
-            # Try old pyJWT syntax first
-            try:
-                subject = jwt.decode(atoken, verify=False).get('sub', None)
-            except:
-                subject = None
-            # Try new pyJWT syntax if old fails
+            subject = self._getClaims(self._session_tokens['vwg'].get('access_token', None)).get('sub', None)
             if subject is None:
-                try:
-                    subject = jwt.decode(atoken, options={'verify_signature': False}).get('sub', None)
-                except:
-                    raise Exception("Could not extract sub attribute from token")
+                raise Exception("Could not extract sub attribute from token")
             legacy_vehicles = await self.get(
                 url=f"https://mal-3a.prd.eu.dp.vwg-connect.com/api/usermanagement/users/v2/users/{subject}/vehicles"
             )
 
             if legacy_vehicles.get('userVehicles', {}).get('vehicle', False):
                 _LOGGER.debug('Found vehicle(s) associated with account.')
-                for vehicle in legacy_vehicles.get('userVehicles').get('vehicle'):
-                    await self.set_token('vwg')
-                    self._session_headers['Accept'] = 'application/vnd.vwg.mbb.vehicleDataDetail_v2_1_0+xml, application/vnd.vwg.mbb.genericError_v1_0_2+xml'
-                    vehicle_vin = vehicle.get('content', '')
-                    response = await self.get(
-                        urljoin(
-                            self._session_auth_ref_url,
-                            f'fs-car/vehicleMgmt/vehicledata/v2/{BRAND}/{COUNTRY}/vehicles/{vehicle_vin}'
-                        )
-                    )
-                    self._session_headers['Accept'] = 'application/json'
-
-                    _LOGGER.debug(f'Response is {response} of type {type(response)}')
-                    if response.get('vehicleDataDetail', False):
-                        data = {
-                            'vin': vehicle["content"],
-                            'specification': {
-                                'modelCode':         response.get('vehicleDataDetail', {}).get('ns4:carportData', {}).get('ns4:modelCode', ''),
-                                'title':             response.get('vehicleDataDetail', {}).get('ns4:carportData', {}).get('ns4:modelName', ''),
-                                'manufacturingDate': response.get('vehicleDataDetail', {}).get('ns4:carportData', {}).get('ns4:modelYear', ''),
-                                'color':             response.get('vehicleDataDetail', {}).get('ns4:carportData', {}).get('ns4:color', ''),
-                                'countryCode':       response.get('vehicleDataDetail', {}).get('ns4:carportData', {}).get('ns4:countryCode', ''),
-                                'engine':            response.get('vehicleDataDetail', {}).get('ns4:carportData', {}).get('ns4:engine', ''),
-                                'mmi':               response.get('vehicleDataDetail', {}).get('ns4:carportData', {}).get('ns4:mmi', ''),
-                                'transmission':      response.get('vehicleDataDetail', {}).get('ns4:carportData', {}).get('ns4:transmission', ''),
-                            }
-                        }
-                        response['vin'] = vehicle["content"]
-                        api_vehicles.append(data)
+                vins = [vehicle.get('content', '') for vehicle in legacy_vehicles.get('userVehicles').get('vehicle')]
+                # Fetch vehicle details concurrently, gather keeps results in account order
+                semaphore = asyncio.Semaphore(self._session_concurrency)
+                details = await asyncio.gather(
+                    *[self._getVehicleDetail(vin, semaphore) for vin in vins],
+                    return_exceptions=True
+                )
+                for vin, detail in zip(vins, details):
+                    if isinstance(detail, dict):
+                        api_vehicles.append(detail)
                     else:
-                        _LOGGER.warning(f"Failed to aquire information about vehicle with VIN {vehicle}")
+                        _LOGGER.warning(f"Failed to aquire information about vehicle with VIN {vin}: {detail}")
         except:
             raise
 
@@ -792,32 +1023,45 @@ class Connection:
             except:
                 raise SeatLoginFailedException("Unable to fetch associated vehicles for account")
         # Update data for all vehicles
-        await self.update_all()
+        if update:
+            await self.update_all()
 
         return api_vehicles
 
+    async def _getVehicleDetail(self, vin, semaphore):
+        """Get vehicle specification from vehicleDataDetail, returns None if not available."""
+        async with semaphore:
+            await self.set_token('vwg')
+            response = await self.get(
+                urljoin(
+                    self._session_auth_ref_url,
+                    f'fs-car/vehicleMgmt/vehicledata/v2/{BRAND}/{COUNTRY}/vehicles/{vin}'
+                ),
+                headers={'Accept': 'application/vnd.vwg.mbb.vehicleDataDetail_v2_1_0+xml, application/vnd.vwg.mbb.genericError_v1_0_2+xml'},
+                fields=['vehicleDataDetail'] + [f'carportData/{field}' for field in CARPORT_FIELDS.values()]
+            )
+        _LOGGER.debug(f'Response is {response} of type {type(response)}')
+        if 'vehicleDataDetail' not in response:
+            return None
+        return {
+            'vin': vin,
+            'specification': {
+                key: response.get(f'carportData/{field}', '') for key, field in CARPORT_FIELDS.items()
+            }
+        }
+
  #### API get data functions ####
    # Profile related functions
     async def getConsentInfo(self):
         """Get consent information for user."""
         try:
             await self.set_token(BRAND)
-            atoken = self._session_tokens[BRAND]['access_token']
-            # Try old pyJWT syntax first
-            try:
-                subject = jwt.decode(atoken, verify=False).get('sub', None)
-            except:
-                subject = None
-            # Try new pyJWT syntax if old fails
+            subject = self._getClaims(self._session_tokens[BRAND]['access_token']).get('sub', None)
             if subject is None:
-                try:
-                    exp = jwt.decode(atoken, options={'verify_signature': False}).get('sub', None)
-                    subject = exp
-                except:
-                    raise Exception("Could not extract sub attribute from token")
+                raise Exception("Could not extract sub attribute from token")
 
             data = {'scopeId': 'commonMandatoryFields'}
-            response = await self.post(f'https://profileintegrityservice.apps.emea.vwapps.io/iaa/pic/v1/users/{subject}/check-profile', json=data)
+            response = await self.post(f'https://profileintegrityservice.apps.emea.vwapps.io/iaa/pic/v1/users/{subject}/check-profile', client=BRAND, json=data)
             if response.get('mandatoryConsentInfo', False):
                 data = {
                     'consentInfo': response
@@ -836,21 +1080,14 @@ class Connection:
         try:
             await self.set_token(BRAND)
             _LOGGER.debug("Attempting extraction of jwt subject from identity token.")
-            atoken = self._session_tokens[BRAND]['access_token']
-            # Try old pyJWT syntax first
-            try:
-                subject = jwt.decode(atoken, verify=False).get('sub', None)
-            except:
-                subject = None
-            # Try new pyJWT syntax if old fails
+            subject = self._getClaims(self._session_tokens[BRAND]['access_token']).get('sub', None)
             if subject is None:
-                try:
-                    subject = jwt.decode(atoken, options={'verify_signature': False}).get('sub', None)
-                except:
-                    raise Exception("Could not extract sub attribute from token")
+                raise Exception("Could not extract sub attribute from token")
 
             response = await self.get(
-                f'https://customer-profile.apps.emea.vwapps.io/v2/customers/{subject}/realCarData'
+                f'https://customer-profile.apps.emea.vwapps.io/v2/customers/{subject}/realCarData',
+                client=BRAND,
+                conditional=True
             )
             if isinstance(response, dict):
                 if response.get('realCars', False):
@@ -868,6 +1105,24 @@ class Connection:
             _LOGGER.warning(f'Could not fetch realCarData, error: {error}')
         return False
 
+    async def getRealCars(self):
+        """Get realCars of account indexed by VIN, fetched once per refresh cycle and shared by all vehicles."""
+        if self._realcars is None:
+            self._realcars = asyncio.ensure_future(self._getRealCarsIndex())
+        return await asyncio.shield(self._realcars)
+
+    async def _getRealCarsIndex(self):
+        data = await self.getRealCarData()
+        if not data:
+            return None
+        payload = data.get('realCars', [])
+        # Unchanged payloads (304 responses return the same object) keep the index and its car objects
+        if self._realcars_index is None or not (payload is self._realcars_payload or payload == self._realcars_payload):
+            _LOGGER.debug('Indexing realCars data by VIN')
+            self._realcars_index = {car.get('vehicleIdentificationNumber', ''): car for car in payload}
+            self._realcars_payload = payload
+        return self._realcars_index
+
    # Vehicle related functions
     async def getHomeRegion(self, vin):
         """Get API requests base url for VIN."""
@@ -899,6 +1154,9 @@ class Connection:
 
     async def getModelImageURL(self, vin, size):
         """Construct the URL for the model image."""
+        size = 'S' if size in ['S', 's', 'Small', 'small'] else 'L'
+        if self._model_images.get(vin, {}).get(size, None):
+            return self._model_images[vin][size]
         try:
             # Construct message to be encrypted
             date = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%mZ')
@@ -922,7 +1180,9 @@ class Connection:
                     allow_redirects=False
                 )
                 if response.headers.get('Location', False):
-                    return response.headers.get('Location').split('?')[0]
+                    url = response.headers.get('Location').split('?')[0]
+                    self._model_images.setdefault(vin, {})[size] = url
+                    return url
                 else:
                     _LOGGER.debug('Could not fetch Model image URL, request returned with status code {response.status_code}')
             except:
@@ -931,19 +1191,31 @@ class Connection:
             _LOGGER.debug('Could not fetch Model image URL, message signing failed.')
         return None
 
-    async def getVehicleStatusReport(self, vin, baseurl):
-        """Get stored vehicle status report (Connect services)."""
+    async def getVehicleStatusReport(self, vin, baseurl, parsed=None):
+        """Get stored vehicle status report (Connect services).
+        Fields are merged into parsed, the previous StoredVehicleDataResponseParsed, ids of changed fields are returned as 'changed'."""
         try:
             await self.set_token('vwg')
+            # With compact state the raw report is not kept for reuse, fields are already merged into parsed
             response = await self.get(
-                f'{baseurl}/fs-car/bs/vsr/v1/{BRAND}/{COUNTRY}/vehicles/{vin}/status'
+                f'{baseurl}/fs-car/bs/vsr/v1/{BRAND}/{COUNTRY}/vehicles/{vin}/status',
+                conditional=True,
+                keep_response=not self._compact_state
             )
-            if response.get('StoredVehicleDataResponse', {}).get('vehicleData', {}).get('data', {})[0].get('field', {})[0] :
+            vehicledata = response.get('StoredVehicleDataResponse', {}).get('vehicleData', {}).get('data', [])
+            if vehicledata and vehicledata[0].get('field', []):
+                parsed = {} if parsed is None else parsed
                 data = {
-                    'StoredVehicleDataResponse': response.get('StoredVehicleDataResponse', {}),
-                    'StoredVehicleDataResponseParsed': dict([(e['id'],e if 'value' in e else '') for f in [s['field'] for s in response['StoredVehicleDataResponse']['vehicleData']['data']] for e in f])
+                    'StoredVehicleDataResponseParsed': parsed,
+                    'StoredVehicleDataResponseSentUtc': vehicledata[0]['field'][0].get('tsCarSentUtc', None),
+                    'changed': update_fields(parsed, vehicledata)
                 }
+                # Raw response is only kept for debugging
+                if self._session_fulldebug:
+                    data['StoredVehicleDataResponse'] = response.get('StoredVehicleDataResponse', {})
                 return data
+            elif response.get('status_code', 0) == 304 and parsed is not None:
+                return {'StoredVehicleDataResponseParsed': parsed, 'changed': set()}
             elif response.get('status_code', {}):
                 _LOGGER.warning(f'Could not fetch vehicle status report, HTTP status code: {response.get("status_code")}')
             else:
@@ -956,7 +1228,7 @@ class Connection:
         """Get short term trip statistics."""
         try:
             await self.set_token('vwg')
-            response = await self.get(f'{baseurl}/fs-car/bs/tripstatistics/v1/{BRAND}/{COUNTRY}/vehicles/{vin}/tripdata/shortTerm?newest')
+            response = await self.get(f'{baseurl}/fs-car/bs/tripstatistics/v1/{BRAND}/{COUNTRY}/vehicles/{vin}/tripdata/shortTerm?newest', conditional=True)
             if response.get('tripData', {}):
                 data = {'tripstatistics': response.get('tripData', {})}
                 return data
@@ -999,7 +1271,7 @@ class Connection:
         """Get departure timers."""
         try:
             await self.set_token('vwg')
-            response = await self.get(f'{baseurl}/fs-car/bs/departuretimer/v1/{BRAND}/{COUNTRY}/vehicles/{vin}/timer')
+            response = await self.get(f'{baseurl}/fs-car/bs/departuretimer/v1/{BRAND}/{COUNTRY}/vehicles/{vin}/timer', conditional=True)
             if response.get('timer', {}):
                 data = {'departuretimer': response.get('timer', {})}
                 return data
@@ -1012,13 +1284,20 @@ class Connection:
         return False
 
     async def getClimater(self, vin, baseurl):
-        """Get climatisation data."""
+        """Get climatisation data, True if unchanged since last fetch with compact state."""
         try:
             await self.set_token('vwg')
-            response = await self.get(f'{baseurl}/fs-car/bs/climatisation/v1/{BRAND}/{COUNTRY}/vehicles/{vin}/climater')
+            response = await self.get(
+                f'{baseurl}/fs-car/bs/climatisation/v1/{BRAND}/{COUNTRY}/vehicles/{vin}/climater',
+                conditional=True,
+                keep_response=not self._compact_state
+            )
             if response.get('climater', {}):
                 data = {'climater': response.get('climater', {})}
                 return data
+            elif response.get('status_code', 0) == 304:
+                # Payload is not kept with compact state, decoded data of vehicle is unchanged
+                return True
             elif response.get('status_code', {}):
                 _LOGGER.warning(f'Could not fetch climatisation, HTTP status code: {response.get("status_code")}')
             else:
@@ -1028,13 +1307,20 @@ class Connection:
         return False
 
     async def getCharger(self, vin, baseurl):
-        """Get charger data."""
+        """Get charger data, True if unchanged since last fetch with compact state."""
         try:
             await self.set_token('vwg')
-            response = await self.get(f'{baseurl}/fs-car/bs/batterycharge/v1/{BRAND}/{COUNTRY}/vehicles/{vin}/charger')
+            response = await self.get(
+                f'{baseurl}/fs-car/bs/batterycharge/v1/{BRAND}/{COUNTRY}/vehicles/{vin}/charger',
+                conditional=True,
+                keep_response=not self._compact_state
+            )
             if response.get('charger', {}):
                 data = {'charger': response.get('charger', {})}
                 return data
+            elif response.get('status_code', 0) == 304:
+                # Payload is not kept with compact state, decoded data of vehicle is unchanged
+                return True
             elif response.get('status_code', {}):
                 _LOGGER.warning(f'Could not fetch charger, HTTP status code: {response.get("status_code")}')
             else:
@@ -1117,6 +1403,10 @@ class Connection:
             _LOGGER.warning(f'Failure during get request status: {error}')
             raise SeatException(f'Failure during get request status: {error}')
 
+    async def wait_for_request(self, vin, sectionId, requestId, baseurl):
+        """Wait for final status of a request ID, status is polled together with other outstanding requests."""
+        return await self._request_tracker.wait(vin, sectionId, requestId, baseurl)
+
     async def get_sec_token(self, vin, spin, action, baseurl):
         """Get a security token, required for certain set functions."""
         secbase = 'https://msg.volkswagen.de'
@@ -1153,9 +1443,11 @@ class Connection:
                     'securityToken': secToken
                 }
             }
-            self._session_headers['Content-Type'] = 'application/json'
-            response = await self.post(f'{secbase}/api/rolesrights/authorization/v2/security-pin-auth-completed', json = body)
-            self._session_headers.pop('Content-Type', None)
+            response = await self.post(
+                f'{secbase}/api/rolesrights/authorization/v2/security-pin-auth-completed',
+                headers={'Content-Type': 'application/json'},
+                json = body
+            )
             if response.get('securityToken', False):
                 return response['securityToken']
             else:
@@ -1165,15 +1457,13 @@ class Connection:
             raise
 
    # VW-Group API methods
-    async def _setVWAPI(self, endpoint, **data):
+    async def _setVWAPI(self, endpoint, headers=None, **data):
         """Data call through VW-Group API."""
         try:
             await self.set_token('vwg')
             # Combine homeregion with endpoint URL
             url = endpoint #urljoin(self._session_auth_ref_url, endpoint)
-            response = await self._data_call(url, **data)
-            self._session_headers.pop('X-mbbSecToken', None)
-            self._session_headers.pop('X-securityToken', None)
+            response = await self._data_call(url, headers=headers, **data)
             if not response:
                 raise SeatException(f'Invalid or no response for endpoint {endpoint}')
             elif response == 429:
@@ -1196,8 +1486,6 @@ class Connection:
                     data['rate_limit_remaining'] = response.get('rate_limit_remaining', None)
                 return data
         except:
-            self._session_headers.pop('X-mbbSecToken', None)
-            self._session_headers.pop('X-securityToken', None)
             raise
         return False
 
@@ -1208,10 +1496,11 @@ class Connection:
     async def setClimater(self, vin, baseurl, data, spin):
         """Execute climatisation actions."""
         try:
+            headers = {}
             # Only get security token if auxiliary heater is to be started
             if data.get('action', {}).get('settings', {}).get('heaterSource', None) == 'auxiliary':
-                self._session_headers['X-securityToken'] = await self.get_sec_token(vin=vin, spin=spin, action='rclima', baseurl=baseurl)
-            return await self._setVWAPI(f'{baseurl}/fs-car/bs/climatisation/v1/{BRAND}/{COUNTRY}/vehicles/{vin}/climater/actions', json = data)
+                headers['X-securityToken'] = await self.get_sec_token(vin=vin, spin=spin, action='rclima', baseurl=baseurl)
+            return await self._setVWAPI(f'{baseurl}/fs-car/bs/climatisation/v1/{BRAND}/{COUNTRY}/vehicles/{vin}/climater/actions', headers=headers, json = data)
         except:
             raise
         return False
@@ -1223,7 +1512,8 @@ class Connection:
             departuretimers = await self.getDeparturetimer(vin, baseurl)
             timer = departuretimers.get('departuretimer', {}).get('timersAndProfiles', {}).get('timerList', {}).get('timer', [])
             profile = departuretimers.get('departuretimer', {}).get('timersAndProfiles', {}).get('timerProfileList', {}).get('timerProfile', [])
-            setting = departuretimers.get('departuretimer', {}).get('timersAndProfiles', {}).get('timerBasicSetting', [])
+            # Copy settings, the fetched data might be a cached response that must not be modified
+            setting = dict(departuretimers.get('departuretimer', {}).get('timersAndProfiles', {}).get('timerBasicSetting', {}))
 
             # Construct Timer data
             timers = [{},{},{}]
@@ -1320,7 +1610,7 @@ class Connection:
             await self.set_token('vwg')
             # Only get security token if auxiliary heater is to be enabled
             #if data.get... == 'auxiliary':
-            #   self._session_headers['X-securityToken'] = await self.get_sec_token(vin = vin, spin = spin, action = 'timer')
+            #   headers['X-securityToken'] = await self.get_sec_token(vin = vin, spin = spin, action = 'timer')
             return await self._setVWAPI(f'{baseurl}/fs-car/bs/departuretimer/v1/{BRAND}/{COUNTRY}/vehicles/{vin}/timer/actions', json = body)
         except:
             raise
@@ -1333,59 +1623,31 @@ class Connection:
     async def setLock(self, vin, baseurl, data, spin):
         """Remote lock and unlock actions."""
         try:
-            # Save Content-Type header to be restored later
-            if 'Content-Type' in self._session_headers:
-                contType = self._session_headers['Content-Type']
-            else:
-                contType = False
             # Fetch security token for lock/unlock
             if 'unlock' in data:
-                self._session_headers['X-mbbSecToken'] = await self.get_sec_token(vin=vin, spin=spin, action='unlock', baseurl=baseurl)
+                secToken = await self.get_sec_token(vin=vin, spin=spin, action='unlock', baseurl=baseurl)
             else:
-                self._session_headers['X-mbbSecToken'] = await self.get_sec_token(vin=vin, spin=spin, action='lock', baseurl=baseurl)
-            # Set temporary Content-Type
-            self._session_headers['Content-Type'] = 'application/vnd.vwg.mbb.RemoteLockUnlock_v1_0_0+xml'
-
-            response = await self._setVWAPI(f'{baseurl}/fs-car/bs/rlu/v1/{BRAND}/{COUNTRY}/vehicles/{vin}/actions', data = data)
-
-            # Clean up content-type
-            self._session_headers.pop('Content-Type', None)
-            if contType: self._session_headers['Content-Type'] = contType
-
-            return response
-
+                secToken = await self.get_sec_token(vin=vin, spin=spin, action='lock', baseurl=baseurl)
+            headers = {
+                'X-mbbSecToken': secToken,
+                'Content-Type': 'application/vnd.vwg.mbb.RemoteLockUnlock_v1_0_0+xml'
+            }
+            return await self._setVWAPI(f'{baseurl}/fs-car/bs/rlu/v1/{BRAND}/{COUNTRY}/vehicles/{vin}/actions', headers=headers, data = data)
         except:
-            self._session_headers.pop('Content-Type', None)
-            if contType: self._session_headers['Content-Type'] = contType
             raise
         return False
 
     async def setPreHeater(self, vin, baseurl, data, spin):
         """Petrol/diesel parking heater actions."""
         try:
-            if 'Content-Type' in self._session_headers:
-                contType = self._session_headers['Content-Type']
-            else:
-                contType = ''
-            self._session_headers['Content-Type'] = 'application/vnd.vwg.mbb.RemoteStandheizung_v2_0_2+json'
+            headers = {'Content-Type': 'application/vnd.vwg.mbb.RemoteStandheizung_v2_0_2+json'}
             if isinstance(data, dict):
                 if not 'quickstop' in data.get('performAction'):
-                    self._session_headers['x-mbbSecToken'] = await self.get_sec_token(vin=vin, spin=spin, action='heating', baseurl=baseurl)
+                    headers['x-mbbSecToken'] = await self.get_sec_token(vin=vin, spin=spin, action='heating', baseurl=baseurl)
             else:
                 raise SeatConfigException("Invalid data for preheater")
-            response = await self._setVWAPI(f'{baseurl}/fs-car/bs/rs/v1/{BRAND}/{COUNTRY}/vehicles/{vin}/action', json = data)
-
-            # Clean up headers
-            self._session_headers.pop('x-mbbSecToken', None)
-            self._session_headers.pop('Content-Type', None)
-            if contType: self._session_headers['Content-Type'] = contType
-
-            return response
-
-        except Exception as error:
-            self._session_headers.pop('x-mbbSecToken', None)
-            self._session_headers.pop('Content-Type', None)
-            if contType: self._session_headers['Content-Type'] = contType
+            return await self._setVWAPI(f'{baseurl}/fs-car/bs/rs/v1/{BRAND}/{COUNTRY}/vehicles/{vin}/action', headers=headers, json = data)
+        except:
             raise
         return False
 
@@ -1394,21 +1656,48 @@ class Connection:
         return await self._setVWAPI(f'{baseurl}/fs-car/bs/vsr/v1/{BRAND}/{COUNTRY}/vehicles/{vin}/requests', data=None)
 
  #### Token handling ####
+    def _getClaims(self, token):
+        """Return unverified claims (exp, sub, aud, kid) of a token, decode each token only once."""
+        if not token:
+            return {}
+        claims = self._session_claims.get(token, None)
+        if claims is not None:
+            return claims
+        # Try old pyJWT syntax first
+        try:
+            payload = jwt.decode(token, verify=False)
+        except:
+            payload = None
+        # Try new pyJWT syntax if old fails
+        if payload is None:
+            try:
+                payload = jwt.decode(token, options={'verify_signature': False})
+            except:
+                return {}
+        try:
+            kid = jwt.get_unverified_header(token).get('kid', None)
+        except:
+            kid = None
+        claims = {
+            'exp': payload.get('exp', None),
+            'sub': payload.get('sub', None),
+            'aud': payload.get('aud', None),
+            'kid': kid
+        }
+        # Forget claims of expired tokens to keep cache small
+        now = time.time()
+        for key in [key for key, value in self._session_claims.items() if int(value.get('exp', None) or 0) < now]:
+            self._session_claims.pop(key, None)
+        self._session_claims[token] = claims
+        return claims
+
     async def validate_token(self, token):
         """Function to validate a single token."""
         try:
             now = datetime.now()
-            # Try old pyJWT syntax first
-            try:
-                exp = jwt.decode(token, verify=False).get('exp', None)
-            except:
-                exp = None
-            # Try new pyJWT syntax if old fails
+            exp = self._getClaims(token).get('exp', None)
             if exp is None:
-                try:
-                    exp = jwt.decode(token, options={'verify_signature': False}).get('exp', None)
-                except:
-                    raise Exception("Could not extract exp attribute")
+                raise Exception("Could not extract exp attribute")
 
             expires = datetime.fromtimestamp(int(exp))
 
@@ -1424,19 +1713,11 @@ class Connection:
 
     async def verify_token(self, token):
         """Function to verify a single token."""
+        aud = None
         try:
-            req = None
-            # Try old pyJWT syntax first
-            try:
-                aud = jwt.decode(token, verify=False).get('aud', None)
-            except:
-                aud = None
-            # Try new pyJWT syntax if old fails
+            aud = self._getClaims(token).get('aud', None)
             if aud is None:
-                try:
-                    aud = jwt.decode(token, options={'verify_signature': False}).get('aud', None)
-                except:
-                    raise Exception("Could not extract exp attribute")
+                raise Exception("Could not extract aud attribute")
 
             if not isinstance(aud, str):
                 aud = next(iter(aud))
@@ -1446,29 +1727,17 @@ class Connection:
                 if self._session_fulldebug:
                     _LOGGER.debug(f"Matching {aud} against {CLIENT_LIST[client].get('CLIENT_ID', '')}")
                 if aud == CLIENT_LIST[client].get('CLIENT_ID', ''):
-                    req = await self._session.get(url = 'https://identity.vwgroup.io/oidc/v1/keys')
+                    url = AUTH_TOKENKEYS
                     break
-
             # If no match for "BRAND" clients, assume token is issued from https://mbboauth-1d.prd.ece.vwg-connect.com/mbbcoauth
-            if req is None:
-                req = await self._session.get(url = 'https://mbboauth-1d.prd.ece.vwg-connect.com/mbbcoauth/public/jwk/v1')
-
-            # Fetch key list
-            keys = await req.json()
-            pubkeys = {}
-            # Convert all RSA keys and store in list
-            for jwk in keys['keys']:
-                kid = jwk['kid']
-                if jwk['kty'] == 'RSA':
-                    pubkeys[kid] = jwt.algorithms.RSAAlgorithm.from_jwk(to_json(jwk))
+            else:
+                url = AUTH_VWGKEYS
+
             # Get key ID from token and get match from key list
-            token_kid = jwt.get_unverified_header(token)['kid']
+            token_kid = self._getClaims(token).get('kid', None)
+            pubkey = await self._getPublicKey(url, token_kid)
             if self._session_fulldebug:
-                try:
-                    _LOGGER.debug(f'Token Key ID is {token_kid}, match from public keys: {keys["keys"][token_kid]}')
-                except:
-                    pass
-            pubkey = pubkeys[token_kid]
+                _LOGGER.debug(f'Token Key ID is {token_kid}, match from public keys: {pubkey}')
 
             # Verify token with public key
             if jwt.decode(token, key=pubkey, algorithms=['RS256'], audience=aud):
@@ -1479,6 +1748,57 @@ class Connection:
             _LOGGER.debug(f'Failed to verify {aud} token, error: {error}')
             return error
 
+    async def _getPublicKey(self, url, kid):
+        """Return public key with ID kid from key set at url, fetch key set only if needed."""
+        now = datetime.now()
+        cached = JWKS_CACHE.setdefault(url, {})
+        if kid in cached.get('keys', {}) and cached.get('expires', now) > now:
+            return cached['keys'][kid]
+
+        # Key set is missing, stale or does not contain the key ID, concurrent callers share one fetch
+        if cached.get('fetch', None) is None:
+            cached['fetch'] = asyncio.ensure_future(self._fetchKeySet(url))
+            cached['fetch'].add_done_callback(lambda fetch: cached.pop('fetch', None))
+        try:
+            await asyncio.shield(cached['fetch'])
+        except Exception as error:
+            # Fall back on stale keys if key set can't be refreshed
+            if kid in cached.get('keys', {}):
+                _LOGGER.debug(f'Could not refresh token signing keys, using cached keys. Error: {error}')
+                return cached['keys'][kid]
+            raise
+        return cached['keys'][kid]
+
+    async def _fetchKeySet(self, url):
+        """Fetch key set at url and store its RSA keys in JWKS_CACHE."""
+        _LOGGER.debug(f'Fetching token signing keys from {url}')
+        now = datetime.now()
+        req = await self._session.get(url = url)
+        if req.status != 200:
+            raise SeatException(f'Key set request returned with status code {req.status}')
+        keys = await req.json()
+        pubkeys = {}
+        # Convert all RSA keys and store in dict with key ID as key
+        for jwk in keys['keys']:
+            if jwk['kty'] == 'RSA':
+                pubkeys[jwk['kid']] = jwt.algorithms.RSAAlgorithm.from_jwk(to_json(jwk))
+
+        # Respect cache headers from server, fall back to default TTL
+        ttl = JWKS_TTL
+        cache_control = req.headers.get('Cache-Control', '')
+        max_age = re.search('max-age=([0-9]+)', cache_control)
+        if 'no-store' in cache_control or 'no-cache' in cache_control:
+            ttl = 0
+        elif max_age:
+            ttl = int(max_age.group(1))
+        elif req.headers.get('Expires', False):
+            try:
+                expires = parsedate_to_datetime(req.headers.get('Expires'))
+                ttl = max(0, int((expires - datetime.now(timezone.utc)).total_seconds()))
+            except:
+                pass
+        JWKS_CACHE.setdefault(url, {}).update(keys=pubkeys, expires=now + timedelta(seconds=ttl))
+
     async def refresh_token(self, client):
         """Function to refresh tokens for a client."""
         try:
@@ -1535,8 +1855,16 @@ class Connection:
 
     async def set_token(self, client):
         """Switch between tokens."""
+        # Fast path, token is still valid and no lock is needed
+        if self._token_valid(client):
+            return True
+
         # Lock to prevent multiple instances updating tokens simultaneously
         async with self._lock:
+            # Token might have been refreshed by someone else while we waited for the lock
+            if self._token_valid(client):
+                return True
+
             # If no tokens are available for client, try to authorize
             tokens = self._session_tokens.get(client, None)
             if tokens is None:
@@ -1565,28 +1893,51 @@ class Connection:
                         _LOGGER.debug(f'Tokens refreshed successfully for client "{client}"')
                         pass
                 else:
-                    try:
-                        dt = datetime.fromtimestamp(valid)
-                        _LOGGER.debug(f'Access token for "{client}" is valid until {dt.strftime("%Y-%m-%d %H:%M:%S")}')
-                    except:
-                        pass
-                # Assign token to authorization header
-                self._session_headers['Authorization'] = 'Bearer ' + self._session_tokens[client]['access_token']
-                if client == 'seat':
-                    self._session_headers['tokentype'] = 'IDK_TECHNICAL'
-                elif client == 'skoda':
-                    self._session_headers['tokentype'] = 'IDK_TECHNICAL'
-                elif client == 'connect':
-                    self._session_headers['tokentype'] = 'IDK_CONNECT'
-                elif client == 'smartlink':
-                    self._session_headers['tokentype'] = 'IDK_SMARTLINK'
-                else:
-                    self._session_headers['tokentype'] = 'MBB'
+                    _LOGGER.debug(f'Access token for "{client}" is valid until {valid.strftime("%Y-%m-%d %H:%M:%S")}')
             except:
                 raise SeatException(f'Failed to set token for "{client}"')
+            if tokens is None or not valid:
+                await self._saveSession()
             return True
 
+    def _token_valid(self, client):
+        """Return true if client has an access token that has not expired."""
+        token = self._session_tokens.get(client, {}).get('access_token', None)
+        if not token:
+            return False
+        exp = self._getClaims(token).get('exp', None)
+        if exp is None:
+            return False
+        return int(exp) > time.time()
+
+    def _auth_headers(self, client):
+        """Return authorization headers with access token for client."""
+        token = self._session_tokens.get(client, {}).get('access_token', None)
+        if not token:
+            return {}
+        if client == 'seat':
+            tokentype = 'IDK_TECHNICAL'
+        elif client == 'skoda':
+            tokentype = 'IDK_TECHNICAL'
+        elif client == 'connect':
+            tokentype = 'IDK_CONNECT'
+        elif client == 'smartlink':
+            tokentype = 'IDK_SMARTLINK'
+        else:
+            tokentype = 'MBB'
+        return {
+            'Authorization': 'Bearer ' + token,
+            'tokentype': tokentype
+        }
+
  #### Class helpers ####
+    @property
+    def rate_limits(self):
+        """Return rate limiter state and wait times."""
+        if self._ratelimiter is None:
+            return {}
+        return self._ratelimiter.metrics
+
     @property
     def vehicles(self):
         """Return list of Vehicle objects."""
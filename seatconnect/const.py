@@ -23,6 +23,9 @@ XAPPNAME = 'SEATConnect'
 USER_AGENT = 'okhttp/3.10.0'
 APP_URI = 'cupraconnect://identity-kit/login'
 
+# Lifetime in seconds of cached token signing keys, used if server sends no cache headers
+JWKS_TTL = 3600
+
 HEADERS_SESSION = {
     'Connection': 'keep-alive',
     'Content-Type': 'application/json',
@@ -139,4 +142,30 @@ PIN_UNLOCK = '/api/rolesrights/authorization/v2/vehicles/$vin/services/rlu_v1/op
 PIN_HEATING = '/api/rolesrights/authorization/v2/vehicles/$vin/services/rheating_v1/operations/P_QSACT/security-pin-auth-requested'
 PIN_TIMER = '/api/rolesrights/authorization/v2/vehicles/$vin/services/timerprogramming_v1/operations/P_SETTINGS_AU/security-pin-auth-requested'
 PIN_RCLIMA = '/api/rolesrights/authorization/v2/vehicles/$vin/services/rclima_v1/operations/P_START_CLIMA_AU/security-pin-auth-requested'
-PIN_COMPLETE = '/api/rolesrights/authorization/v2/security-pin-auth-completed'
\ No newline at end of file
+PIN_COMPLETE = '/api/rolesrights/authorization/v2/security-pin-auth-completed'
+
+# Refresh intervals in seconds per endpoint and vehicle state, used with Connection(..., poll_intervals=True)
+# The state is the first of moving, charging, external_power, active (connected within POLL_ACTIVE seconds) and parked
+POLL_INTERVALS = {
+    'preheater': {'moving': 300, 'charging': 900, 'external_power': 900, 'active': 300, 'parked': 1800},
+    'climater': {'moving': 300, 'charging': 300, 'external_power': 600, 'active': 120, 'parked': 1800},
+    'trip_statistic': {'moving': 600, 'charging': 3600, 'external_power': 3600, 'active': 300, 'parked': 3600},
+    'position': {'moving': 60, 'charging': 1800, 'external_power': 1800, 'active': 120, 'parked': 3600},
+    'statusreport': {'moving': 60, 'charging': 300, 'external_power': 600, 'active': 60, 'parked': 900},
+    'charger': {'moving': 600, 'charging': 60, 'external_power': 300, 'active': 300, 'parked': 1800},
+    'timerprogramming': {'moving': 3600, 'charging': 3600, 'external_power': 3600, 'active': 1800, 'parked': 3600}
+}
+POLL_ACTIVE = 900
+
+# Max age in seconds of endpoint data skipped with Connection(..., status_first=True)
+MAX_STALENESS = 3600
+
+# Action requests after whose completion endpoint data is fetched regardless of interval, {endpoint: request sections}
+POLL_TRIGGERS = {
+    'preheater': ('preheater',),
+    'climater': ('climatisation',),
+    'position': ('refresh',),
+    'statusreport': ('lock', 'refresh'),
+    'charger': ('batterycharge',),
+    'timerprogramming': ('departuretimer',)
+}
@@ -1,6 +1,7 @@
 # Utilities for integration with Home Assistant
 # Thanks to molobrakos
 
+import copy
 import logging
 from datetime import datetime
 from seatconnect.utilities import camel2slug
@@ -15,6 +16,7 @@ class Instrument:
         self.vehicle = None
         self.icon = icon
         self.callback = None
+        self._supported = 'is_' + attr + '_supported'
 
     def __repr__(self):
         return self.full_name
@@ -34,6 +36,16 @@ class Instrument:
         self.configurate(**config)
         return True
 
+    def bind(self, vehicle, **config):
+        """Return configured copy of instrument bound to vehicle, the instrument itself is not changed."""
+        instrument = copy.copy(self)
+        instrument.vehicle = vehicle
+        instrument.configurate(**config)
+        return instrument
+
+    def supported_by(self, vehicle):
+        return getattr(vehicle, self._supported, False)
+
     @property
     def vehicle_name(self):
         return self.vehicle.vin
@@ -64,11 +76,7 @@ class Instrument:
 
     @property
     def is_supported(self):
-        supported = 'is_' + self.attr + "_supported"
-        if hasattr(self.vehicle, supported):
-            return getattr(self.vehicle, supported)
-        else:
-            return False
+        return self.supported_by(self.vehicle)
 
 
 class Sensor(Instrument):
@@ -1171,13 +1179,42 @@ def create_instruments():
     ]
 
 
+# Instrument prototypes, created once and only used through bound copies
+INSTRUMENTS = tuple(create_instruments())
+
+
 class Dashboard:
+    """Instruments supported by vehicle, bound copies of the INSTRUMENTS prototypes.
+
+    Instruments not yet supported are probed again when the vehicle state version changes.
+    Bound instruments are kept, so callbacks set on them survive updates.
+    """
     def __init__(self, vehicle, **config):
         self._config = config
-        self.instruments = [
-            instrument
-            for instrument in create_instruments()
-            if instrument.setup(vehicle, **config)
-        ]
+        self._vehicle = vehicle
+        self._version = None
+        # {prototype index: bound instrument}
+        self._bound = {}
+        self._instruments = []
         _LOGGER.debug("Supported instruments: " + ", ".join(str(inst.attr) for inst in self.instruments))
 
+    @property
+    def instruments(self):
+        version = self._vehicle.state_version
+        if version != self._version:
+            self._version = version
+            added = False
+            for index, prototype in enumerate(INSTRUMENTS):
+                if index not in self._bound and prototype.supported_by(self._vehicle):
+                    self._bound[index] = prototype.bind(self._vehicle, **self._config)
+                    added = True
+            if added:
+                self._instruments = [self._bound[index] for index in sorted(self._bound)]
+        return self._instruments
+
+    def reconfigure(self, **config):
+        """Rebind supported instruments with new config, without probing support again."""
+        self._config = config
+        self._bound = {index: INSTRUMENTS[index].bind(self._vehicle, **config) for index in self._bound}
+        self._instruments = [self._bound[index] for index in sorted(self._bound)]
+
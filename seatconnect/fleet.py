@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Management of many Seat Connect accounts from one scheduler."""
+import heapq
+import logging
+import asyncio
+
+from seatconnect.connection import Connection, JWKS_CACHE
+from seatconnect.cache import DiscoveryCache
+from seatconnect.exceptions import SeatInvalidRequestException
+
+_LOGGER = logging.getLogger(__name__)
+
+# Default priority of scheduled updates, lower values are updated first when several are due
+PRIORITY = 10
+
+
+class Fleet:
+    """Update vehicles of many accounts, each with its own Connection, from one priority queue.
+
+    Vehicle updates are queued by due time, due updates are started by priority. At most concurrency
+    updates run at once and at most account_concurrency per account. Each vehicle is updated again
+    interval seconds after its update finished. Connections share the connection pool of session, a discovery
+    cache and model image URLs, each keeps login cookies in a jar of its own. Token signing keys are shared
+    by all connections in process.
+    Other keyword arguments are passed on to every Connection.
+    """
+
+    def __init__(self, session, interval=300, concurrency=20, account_concurrency=2, discovery_cache=None, **optional):
+        self._session = session
+        self._interval = interval
+        self._concurrency = concurrency
+        self._account_concurrency = account_concurrency
+        self._optional = optional
+        self._discovery_cache = DiscoveryCache(discovery_cache) if discovery_cache else None
+        self._model_images = {}
+        self._accounts = {}
+        # Scheduled updates, heap of (due, priority, seq, (username, vin)), superseded entries are skipped
+        self._queue = []
+        # Due updates waiting for a free slot, heap of (priority, due, seq, (username, vin))
+        self._ready = []
+        self._scheduled = {}
+        self._seq = 0
+        self._running = {}
+        self._account_running = {}
+        self._wakeup = asyncio.Event()
+        self._task = None
+        self._stopping = False
+        self._metrics = {'updates': 0, 'failures': 0, 'update_time': 0.0, 'max_lag': 0.0}
+
+    async def add_account(self, username, password, **optional):
+        """Login and fetch vehicles of account, schedule update of all vehicles. Return Connection or False.
+        Vehicles are first updated by the scheduler, within the concurrency limits."""
+        options = dict(self._optional, **optional)
+        options['discovery_cache'] = self._discovery_cache
+        options['model_image_cache'] = self._model_images
+        connection = Connection(self._session, username, password, **options)
+        if not await connection.doLogin():
+            _LOGGER.warning(f'Login failed for account {username}')
+            await connection.close()
+            return False
+        if not await connection.get_vehicles(update=False):
+            _LOGGER.warning(f'Could not fetch vehicles for account {username}')
+            await connection.close()
+            return False
+        self._accounts[username] = connection
+        self._account_running.setdefault(username, 0)
+        for vehicle in connection.vehicles:
+            self.schedule(username, vehicle.vin)
+        return connection
+
+    def remove_account(self, username):
+        """Stop scheduling updates for account, updates already running are completed.
+        The connection of the account is closed once no update of it is running."""
+        connection = self._accounts.pop(username, None)
+        for key in [key for key in self._scheduled if key[0] == username]:
+            del self._scheduled[key]
+        if connection is not None and not self._account_running.get(username, 0):
+            asyncio.ensure_future(connection.close())
+
+    def schedule(self, username, vin, delay=0, priority=PRIORITY):
+        """Schedule update of vehicle in delay seconds, replaces an update already scheduled for the vehicle.
+        Raises SeatInvalidRequestException if the account has not been added."""
+        if username not in self._accounts:
+            raise SeatInvalidRequestException(f'Unknown account {username}')
+        loop = asyncio.get_running_loop()
+        key = (username, vin)
+        self._seq += 1
+        self._scheduled[key] = self._seq
+        heapq.heappush(self._queue, (loop.time() + delay, priority, self._seq, key))
+        self._wakeup.set()
+
+    def start(self):
+        """Start scheduler."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self):
+        """Stop scheduler, wait for running updates to complete, close connections of all accounts and
+        write discovery cache. Accounts are removed, add them again before starting the fleet again."""
+        if self._task is not None:
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+            self._stopping = False
+        if self._running:
+            await asyncio.gather(*self._running.values(), return_exceptions=True)
+        accounts = list(self._accounts.values())
+        self._accounts.clear()
+        self._scheduled.clear()
+        await asyncio.gather(*(connection.close() for connection in accounts), return_exceptions=True)
+        if self._discovery_cache is not None:
+            await self._discovery_cache.flush()
+
+    def _dispatch(self, now):
+        # Move due updates to the ready queue, skipping superseded entries
+        while self._queue and self._queue[0][0] <= now:
+            due, priority, seq, key = heapq.heappop(self._queue)
+            if self._scheduled.get(key, None) == seq:
+                heapq.heappush(self._ready, (priority, due, seq, key))
+        # Start updates by priority while there are free slots, accounts at their limit wait
+        waiting = []
+        while self._ready and len(self._running) < self._concurrency:
+            priority, due, seq, key = heapq.heappop(self._ready)
+            if self._scheduled.get(key, None) != seq:
+                continue
+            if key[0] not in self._accounts:
+                del self._scheduled[key]
+                continue
+            if key in self._running or self._account_running.get(key[0], 0) >= self._account_concurrency:
+                waiting.append((priority, due, seq, key))
+                continue
+            del self._scheduled[key]
+            self._metrics['max_lag'] = max(self._metrics['max_lag'], now - due)
+            self._account_running[key[0]] += 1
+            self._running[key] = asyncio.ensure_future(self._update(key))
+        for entry in waiting:
+            heapq.heappush(self._ready, entry)
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while not self._stopping:
+            self._wakeup.clear()
+            # An update that can't be started must not stop the scheduler
+            try:
+                self._dispatch(loop.time())
+            except Exception as error:
+                _LOGGER.error(f'Failed to start scheduled updates, error: {error}')
+            # Sleep until next update is due, an update completes or an update is scheduled
+            delay = self._queue[0][0] - loop.time() if self._queue else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _update(self, key):
+        username, vin = key
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        result = False
+        connection = self._accounts.get(username, None)
+        try:
+            vehicle = connection.vehicle(vin) if connection is not None else None
+            if vehicle is not None:
+                # Start a new refresh cycle for the account unless other updates of it are running
+                if self._account_running[username] == 1:
+                    await connection.prepare_update()
+                else:
+                    await connection.set_token('vwg')
+                result = await vehicle.update()
+        except Exception as error:
+            _LOGGER.warning(f'Update of {vin} failed, error: {error}')
+        finally:
+            self._running.pop(key, None)
+            self._account_running[username] -= 1
+            # Account was removed while updating, close its connection after the last running update
+            if connection is not None and self._accounts.get(username, None) is not connection and not self._account_running[username]:
+                await connection.close()
+            self._metrics['updates'] += 1
+            self._metrics['update_time'] += loop.time() - started
+            if not result:
+                self._metrics['failures'] += 1
+            if username in self._accounts and key not in self._scheduled:
+                self.schedule(username, vin, delay=self._interval)
+            self._wakeup.set()
+
+    @property
+    def connections(self):
+        """Return Connection objects by username."""
+        return self._accounts
+
+    @property
+    def vehicles(self):
+        """Return Vehicle objects of all accounts."""
+        return [vehicle for connection in self._accounts.values() for vehicle in connection.vehicles]
+
+    @property
+    def metrics(self):
+        """Return update counts, average update time, max scheduling lag and rate limiter state of all accounts."""
+        updates = self._metrics['updates']
+        return {
+            'accounts': len(self._accounts),
+            'vehicles': sum(len(connection.vehicles) for connection in self._accounts.values()),
+            'scheduled': len(self._scheduled),
+            'running': len(self._running),
+            'updates': updates,
+            'failures': self._metrics['failures'],
+            'average_update_time': round(self._metrics['update_time'] / updates, 2) if updates else 0,
+            'max_lag': round(self._metrics['max_lag'], 2),
+            'signing_keys': sum(len(keyset.get('keys', {})) for keyset in JWKS_CACHE.values()),
+            'model_images': len(self._model_images),
+            'rate_limits': {username: connection.rate_limits for username, connection in self._accounts.items()}
+        }
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Typed snapshots of vehicle data for Seat Connect."""
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _int(value):
+    return int(value)
+
+
+def _negated(value):
+    """Service intervals are reported as negative values."""
+    return 0 - int(value)
+
+
+def _temperature(value):
+    """Temperature in dK to °C, False if not reported."""
+    value = int(value)
+    return round(float((value / 10) - 273.15), 1) if value else False
+
+
+# Status report fields, {attribute: (field id, decoder)}
+STATUS_FIELDS = {
+    'parking_light': ('0x0301010001', _int),
+    'distance': ('0x0101010002', _int),
+    'service_inspection': ('0x0203010004', _negated),
+    'service_inspection_distance': ('0x0203010003', _negated),
+    'oil_inspection': ('0x0203010002', _negated),
+    'oil_inspection_distance': ('0x0203010001', _negated),
+    'adblue_level': ('0x02040C0001', _int),
+    'outside_temperature': ('0x0301020001', _temperature),
+    'combined_range': ('0x0301030005', _int),
+    'primary_range': ('0x0301030006', _int),
+    'primary_drive': ('0x0301030007', _int),
+    'secondary_range': ('0x0301030008', _int),
+    'secondary_drive': ('0x0301030009', _int),
+    'fuel_level': ('0x030103000A', _int),
+    'door_locked_left_front': ('0x0301040001', _int),
+    'door_closed_left_front': ('0x0301040002', _int),
+    'door_locked_left_back': ('0x0301040004', _int),
+    'door_closed_left_back': ('0x0301040005', _int),
+    'door_locked_right_front': ('0x0301040007', _int),
+    'door_closed_right_front': ('0x0301040008', _int),
+    'door_locked_right_back': ('0x030104000A', _int),
+    'door_closed_right_back': ('0x030104000B', _int),
+    'trunk_locked': ('0x030104000D', _int),
+    'trunk_closed': ('0x030104000E', _int),
+    'hood_closed': ('0x0301040011', _int),
+    'window_closed_left_front': ('0x0301050001', _int),
+    'window_closed_left_back': ('0x0301050003', _int),
+    'window_closed_right_front': ('0x0301050005', _int),
+    'window_closed_right_back': ('0x0301050007', _int),
+    'sunroof_closed': ('0x030105000B', _int),
+}
+
+
+class StatusReport:
+    """Decoded status report fields.
+
+    Attributes are named as in STATUS_FIELDS, None if the field has no value.
+    present holds the attribute names of all fields in the report, with or without value.
+
+    >>> status = StatusReport({'0x0101010002': {'id': '0x0101010002', 'value': '1234'}, '0x0203010004': ''})
+    >>> status.distance, status.service_inspection, sorted(status.present)
+    (1234, None, ['distance', 'service_inspection'])
+    """
+    __slots__ = ('present',) + tuple(STATUS_FIELDS)
+
+    def __init__(self, parsed=None):
+        parsed = parsed or {}
+        present = []
+        for attribute, (field_id, decoder) in STATUS_FIELDS.items():
+            field = parsed.get(field_id, None)
+            value = None
+            if field is not None:
+                present.append(attribute)
+                if isinstance(field, dict) and field.get('value', None) is not None:
+                    try:
+                        value = decoder(field['value'])
+                    except (TypeError, ValueError):
+                        _LOGGER.debug(f'Could not decode value of field {field_id}: {field["value"]}')
+            setattr(self, attribute, value)
+        self.present = frozenset(present)
+
+
+# Endpoint payload fields used by Vehicle properties, {attribute: path of keys}
+CHARGER_FIELDS = {
+    'charging_state': ('status', 'chargingStatusData', 'chargingState', 'content'),
+    'external_power': ('status', 'chargingStatusData', 'externalPowerSupplyState', 'content'),
+    'energy_flow': ('status', 'chargingStatusData', 'energyFlow', 'content'),
+    'state_of_charge': ('status', 'batteryStatusData', 'stateOfCharge', 'content'),
+    'remaining_charging_time': ('status', 'batteryStatusData', 'remainingChargingTime', 'content'),
+    'plug_lock_state': ('status', 'plugStatusData', 'lockState', 'content'),
+    'plug_state': ('status', 'plugStatusData', 'plugState', 'content'),
+    'max_charge_current': ('settings', 'maxChargeCurrent', 'content'),
+}
+
+CLIMATER_FIELDS = {
+    'target_temperature': ('settings', 'targetTemperature', 'content'),
+    'without_hv_power': ('settings', 'climatisationWithoutHVpower', 'content'),
+    'heater_source': ('settings', 'heaterSource', 'content'),
+    'climatisation_state': ('status', 'climatisationStatusData', 'climatisationState', 'content'),
+    'window_heating_front': ('status', 'windowHeatingStatusData', 'windowHeatingStateFront', 'content'),
+    'window_heating_rear': ('status', 'windowHeatingStatusData', 'windowHeatingStateRear', 'content'),
+}
+
+HEATER_FIELDS = {
+    'climatisation_state': ('climatisationStateReport', 'climatisationState'),
+}
+
+POSITION_FIELDS = {
+    'latitude': ('Position', 'carCoordinate', 'latitude'),
+    'longitude': ('Position', 'carCoordinate', 'longitude'),
+    'parking_time': ('parkingTimeUTC',),
+}
+
+
+class Snapshot:
+    """Values extracted from an endpoint payload, attributes and paths are given by FIELDS.
+
+    Attributes are None if missing from payload, present is True if payload was not empty.
+    raw keeps the payload itself if requested, for debugging.
+    """
+    __slots__ = ('present', 'raw')
+    FIELDS = {}
+
+    def __init__(self, payload=None, keep_raw=False):
+        for attribute, path in self.FIELDS.items():
+            value = payload
+            for key in path:
+                if not isinstance(value, dict):
+                    value = None
+                    break
+                value = value.get(key, None)
+            setattr(self, attribute, value)
+        self.present = bool(payload)
+        self.raw = payload if keep_raw else None
+
+
+class Charger(Snapshot):
+    """Charger state from charger endpoint.
+
+    >>> charger = Charger({'status': {'batteryStatusData': {'stateOfCharge': {'content': 80}}}})
+    >>> charger.present, charger.state_of_charge, charger.plug_state, charger.raw
+    (True, 80, None, None)
+    """
+    __slots__ = tuple(CHARGER_FIELDS)
+    FIELDS = CHARGER_FIELDS
+
+
+class Climater(Snapshot):
+    """Climatisation state from climater endpoint."""
+    __slots__ = tuple(CLIMATER_FIELDS)
+    FIELDS = CLIMATER_FIELDS
+
+
+class Heater(Snapshot):
+    """Parking heater state from pre-heater endpoint."""
+    __slots__ = tuple(HEATER_FIELDS)
+    FIELDS = HEATER_FIELDS
+
+
+class Position(Snapshot):
+    """Parking position from car finder endpoint."""
+    __slots__ = tuple(POSITION_FIELDS)
+    FIELDS = POSITION_FIELDS
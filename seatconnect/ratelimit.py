@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Client side rate limiting for Seat Connect API requests."""
+import re
+import time
+import logging
+import asyncio
+
+from seatconnect.exceptions import SeatThrottledException
+
+_LOGGER = logging.getLogger(__name__)
+
+# Extract VIN from API URLs, ie. ".../vehicles/VSSZZZ.../status"
+VIN_PATTERN = re.compile('/vehicles/([A-Za-z0-9]{17})(?:/|$|\\?)')
+
+
+def vin_from_url(url):
+    """Return VIN from API URL or None.
+
+    >>> vin_from_url('https://x/fs-car/bs/cf/v1/seat/ES/vehicles/VSSZZZKJZLR000000/position')
+    'VSSZZZKJZLR000000'
+
+    >>> vin_from_url('https://x/api/usermanagement/users/v2/users/sub/vehicles')
+
+    """
+    match = VIN_PATTERN.search(url)
+    return match.group(1) if match else None
+
+
+class TokenBucket:
+    """Token bucket, refilled with one token every refill_interval seconds up to capacity."""
+
+    def __init__(self, capacity, refill_interval):
+        self.capacity = capacity
+        self.refill_interval = refill_interval
+        self.tokens = float(capacity)
+        self._updated = time.monotonic()
+        self.waits = 0
+        self.wait_time = 0.0
+        self.rejected = 0
+
+    def _refill(self):
+        now = time.monotonic()
+        if self.refill_interval > 0:
+            self.tokens = min(self.capacity, self.tokens + (now - self._updated) / self.refill_interval)
+        else:
+            self.tokens = float(self.capacity)
+        self._updated = now
+
+    def seed(self, remaining):
+        """Set available tokens to the number of requests the server reports as remaining."""
+        self._refill()
+        self.tokens = float(remaining)
+        self.capacity = max(self.capacity, remaining)
+
+    def delay(self, reserve=0):
+        """Return seconds until a token above reserve is available."""
+        self._refill()
+        missing = reserve + 1 - self.tokens
+        if missing <= 0:
+            return 0
+        if self.refill_interval <= 0:
+            return 0
+        return missing * self.refill_interval
+
+    def take(self):
+        self._refill()
+        self.tokens -= 1
+
+    @property
+    def metrics(self):
+        self._refill()
+        return {
+            'tokens': round(self.tokens, 2),
+            'capacity': self.capacity,
+            'waits': self.waits,
+            'wait_time': round(self.wait_time, 2),
+            'rejected': self.rejected
+        }
+
+
+class RateLimiter:
+    """Rate limiter with one token bucket for the account and one per VIN.
+
+    All requests take a token from the account bucket, polling (reserve > 0) leaves
+    the reserved tokens for actions. Actions also take a token from the VIN bucket,
+    which is seeded from the X-RateLimit-Remaining header of responses.
+    """
+
+    def __init__(self, account_capacity=100, account_refill=0.5, vin_capacity=15, vin_refill=240, reserve=10, max_wait=30):
+        self._account_capacity = account_capacity
+        self._account_refill = account_refill
+        self._vin_capacity = vin_capacity
+        self._vin_refill = vin_refill
+        self._reserve = reserve
+        self._max_wait = max_wait
+        self._account = TokenBucket(account_capacity, account_refill)
+        self._vins = {}
+
+    def _bucket(self, vin):
+        if vin not in self._vins:
+            self._vins[vin] = TokenBucket(self._vin_capacity, self._vin_refill)
+        return self._vins[vin]
+
+    async def acquire(self, vin=None, action=False):
+        """Wait until request may be sent, raise SeatThrottledException if wait is too long."""
+        buckets = [(self._account, 0 if action else self._reserve)]
+        if vin is not None and action:
+            buckets.append((self._bucket(vin), 0))
+        delay = max(bucket.delay(reserve) for bucket, reserve in buckets)
+        if delay > self._max_wait:
+            for bucket, reserve in buckets:
+                if bucket.delay(reserve) > self._max_wait:
+                    bucket.rejected += 1
+            raise SeatThrottledException(f'Rate limit reached{" for " + vin if vin else ""}, next request possible in {int(delay)} seconds')
+        # Take tokens before waiting so that concurrent requests queue up behind this one
+        for bucket, reserve in buckets:
+            if delay > 0 and bucket.delay(reserve) > 0:
+                bucket.waits += 1
+                bucket.wait_time += delay
+            bucket.take()
+        if delay > 0:
+            _LOGGER.debug(f'Rate limiting request{" for " + vin if vin else ""}, waiting {delay:.1f} seconds')
+            await asyncio.sleep(delay)
+
+    def update(self, vin, remaining):
+        """Seed VIN bucket from X-RateLimit-Remaining header value."""
+        if vin is None:
+            return
+        try:
+            self._bucket(vin).seed(int(remaining))
+        except (TypeError, ValueError):
+            pass
+
+    @property
+    def metrics(self):
+        """Return state, waits and wait time for all buckets."""
+        return {
+            'account': self._account.metrics,
+            'vehicles': {vin: bucket.metrics for vin, bucket in self._vins.items()}
+        }
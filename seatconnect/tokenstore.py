@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Token stores for persisting Connection sessions across restarts."""
+import os
+import json
+import hashlib
+import logging
+import asyncio
+import inspect
+from abc import ABC, abstractmethod
+
+from cryptography.fernet import Fernet, InvalidToken
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TokenStore(ABC):
+    """Base class for token stores.
+
+    Session data is a dict with 'tokens' ({client: {token type: token}}) and 'cookies'
+    (list of {'key', 'value', 'domain', 'path'}), stored per account username.
+    """
+
+    @abstractmethod
+    async def load(self, username):
+        """Return stored session data for username, or None."""
+
+    @abstractmethod
+    async def save(self, username, data):
+        """Store session data for username."""
+
+    @abstractmethod
+    async def clear(self, username):
+        """Remove stored session data for username."""
+
+
+class FileTokenStore(TokenStore):
+    """Store sessions in a JSON file, encrypted with Fernet if key is given.
+
+    Generate a key with cryptography.fernet.Fernet.generate_key() and keep it outside the file.
+    Accounts are stored under a hash of the username.
+    """
+
+    def __init__(self, path, key=None):
+        self._path = os.path.expanduser(path)
+        self._fernet = Fernet(key) if key else None
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def _account(username):
+        return hashlib.sha256(username.encode()).hexdigest()
+
+    def _read(self):
+        try:
+            with open(self._path, 'rb') as storefile:
+                content = storefile.read()
+        except FileNotFoundError:
+            return {}
+        try:
+            if self._fernet is not None:
+                content = self._fernet.decrypt(content)
+            data = json.loads(content)
+            return data if isinstance(data, dict) else {}
+        except (InvalidToken, ValueError) as error:
+            _LOGGER.warning(f'Could not read token store {self._path}, error: {error or "invalid key"}')
+            return {}
+
+    def _write(self, data):
+        content = json.dumps(data).encode()
+        if self._fernet is not None:
+            content = self._fernet.encrypt(content)
+        tmpfile = f'{self._path}.tmp'
+        # Tokens grant access to the account, only owner may read the file
+        fd = os.open(tmpfile, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as storefile:
+            storefile.write(content)
+        os.replace(tmpfile, self._path)
+
+    async def _update(self, username, data):
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            stored = await loop.run_in_executor(None, self._read)
+            if data is None:
+                stored.pop(self._account(username), None)
+            else:
+                stored[self._account(username)] = data
+            await loop.run_in_executor(None, self._write, stored)
+
+    async def load(self, username):
+        stored = await asyncio.get_running_loop().run_in_executor(None, self._read)
+        return stored.get(self._account(username), None)
+
+    async def save(self, username, data):
+        await self._update(username, data)
+
+    async def clear(self, username):
+        await self._update(username, None)
+
+
+class CallbackTokenStore(TokenStore):
+    """Store sessions with user supplied callbacks, ie. a keyring or the Home Assistant storage helper.
+
+    load(username) returns session data or None, save(username, data) stores it and
+    clear(username) removes it. Callbacks can be plain functions or coroutine functions.
+    """
+
+    def __init__(self, load, save, clear=None):
+        self._load = load
+        self._save = save
+        self._clear = clear
+
+    @staticmethod
+    async def _call(callback, *args):
+        result = callback(*args)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    async def load(self, username):
+        return await self._call(self._load, username)
+
+    async def save(self, username, data):
+        await self._call(self._save, username, data)
+
+    async def clear(self, username):
+        if self._clear is not None:
+            await self._call(self._clear, username)
+        else:
+            await self._call(self._save, username, None)
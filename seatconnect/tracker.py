@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tracking of outstanding action requests for Seat Connect."""
+import logging
+import asyncio
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RequestTracker:
+    """Poll status of all outstanding action requests from one loop.
+
+    Each request is checked with an interval starting at initial seconds, growing by factor
+    up to max_interval. Requests due within batch_window seconds are checked in the same round,
+    so concurrent actions share polling rounds. Waiting callers get a future per request.
+    """
+
+    def __init__(self, check, initial=2, factor=1.5, max_interval=15, timeout=180, batch_window=1):
+        # check(vin, section, request, baseurl) returns status, 'In progress' while not finished
+        self._check = check
+        self._initial = initial
+        self._factor = factor
+        self._max_interval = max_interval
+        self._timeout = timeout
+        self._batch_window = batch_window
+        # {(vin, section, request): {'future', 'baseurl', 'interval', 'next', 'deadline'}}
+        self._pending = {}
+        self._wakeup = asyncio.Event()
+        self._task = None
+        self.checks = 0
+
+    def track(self, vin, section, request, baseurl):
+        """Start tracking request, return future with final status."""
+        loop = asyncio.get_running_loop()
+        key = (vin, section, str(request))
+        if key not in self._pending:
+            now = loop.time()
+            self._pending[key] = {
+                'future': loop.create_future(),
+                'baseurl': baseurl,
+                'interval': self._initial,
+                'next': now + self._initial,
+                'deadline': now + self._timeout
+            }
+            self._wakeup.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+        return self._pending[key]['future']
+
+    async def wait(self, vin, section, request, baseurl):
+        """Wait for final status of request."""
+        return await asyncio.shield(self.track(vin, section, request, baseurl))
+
+    @property
+    def pending(self):
+        """Return keys of outstanding requests."""
+        return list(self._pending)
+
+    def _resolve(self, key, status):
+        entry = self._pending.pop(key, None)
+        if entry is not None and not entry['future'].done():
+            entry['future'].set_result(status)
+
+    async def _poll(self, key):
+        vin, section, request = key
+        entry = self._pending[key]
+        self.checks += 1
+        try:
+            status = await self._check(vin, section, request, entry['baseurl'])
+        except Exception as error:
+            _LOGGER.warning(f'Exception encountered while waiting for request status: {error}')
+            self._resolve(key, 'Exception')
+            return
+        now = asyncio.get_running_loop().time()
+        if status != 'In progress':
+            self._resolve(key, status)
+        elif now >= entry['deadline']:
+            _LOGGER.info(f'Timeout while waiting for result of {request}.')
+            self._resolve(key, 'Timeout')
+        else:
+            entry['interval'] = min(entry['interval'] * self._factor, self._max_interval)
+            entry['next'] = now + entry['interval']
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while self._pending:
+            now = loop.time()
+            # When a request is due, also check the ones due shortly after
+            if any(entry['next'] <= now for entry in self._pending.values()):
+                due = [key for key, entry in self._pending.items() if entry['next'] <= now + self._batch_window]
+                _LOGGER.debug(f'Checking status of {len(due)} of {len(self._pending)} outstanding requests')
+                await asyncio.gather(*[self._poll(key) for key in due])
+                continue
+            # Sleep until next request is due or a new request is tracked
+            self._wakeup.clear()
+            delay = min(entry['next'] for entry in self._pending.values()) - now
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
@@ -8,6 +8,8 @@ from itertools import product
 import json
 import logging
 import re
+from xml.etree.ElementTree import XMLPullParser
+from lxml import html as lxml_html
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,20 +38,156 @@ def read_config():
     return {}
 
 
+# Timestamps as sent by API, ie. 2021-05-01T12:00:00Z or 2021-05-01T12:00:00+0200
+DATETIME_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(Z|[+-]\d{2}:?\d{2})")
+
+
 def json_loads(s):
     return json.loads(s, object_hook=obj_parser)
 
 
+def parse_datetime(val):
+    """Parse timestamp string, return None if val is not a timestamp.
+
+    >>> parse_datetime('2021-05-01T12:00:00Z')
+    datetime.datetime(2021, 5, 1, 12, 0, tzinfo=datetime.timezone.utc)
+
+    >>> parse_datetime('2021-05-01T12:00:00+0200')
+    datetime.datetime(2021, 5, 1, 12, 0, tzinfo=datetime.timezone(datetime.timedelta(seconds=7200)))
+
+    >>> parse_datetime('2021-05-01')
+
+    """
+    match = DATETIME_PATTERN.fullmatch(val)
+    if match is None:
+        return None
+    offset = match.group(1)
+    if offset == "Z":
+        offset = "+00:00"
+    elif ":" not in offset:
+        offset = offset[:3] + ":" + offset[3:]
+    try:
+        return datetime.fromisoformat(val[:19] + offset)
+    except ValueError:
+        return None
+
+
 def obj_parser(obj):
     """Parse datetime."""
     for key, val in obj.items():
-        try:
-            obj[key] = datetime.strptime(val, "%Y-%m-%dT%H:%M:%S%z")
-        except (TypeError, ValueError):
-            pass
+        # Only strings shaped like a timestamp can be parsed, skip everything else cheaply
+        if isinstance(val, str) and len(val) >= 20 and val[4:5] == "-":
+            parsed = parse_datetime(val)
+            if parsed is not None:
+                obj[key] = parsed
     return obj
 
 
+class XMLExtractor:
+    """Extract text of the first element matching each tag from XML fed in chunks.
+    Tags are local names, namespaces are ignored, and can be scoped by parent: "parent/tag".
+    The root element is found on its start tag, with empty text. Elements are cleared once read,
+    feed returns True when all tags are found and the rest of the document can be skipped.
+
+    >>> extractor = XMLExtractor(['a', 'c/b', 'd'])
+    >>> extractor.feed('<a xmlns:n="urn:x"><n:b>1</n:b><n:c><n:b>2</n:b></n:c>'), extractor.found
+    (False, {'a': '', 'c/b': '2'})
+    >>> extractor = XMLExtractor(['a', 'b'])
+    >>> extractor.feed(b'<a><b>1</b><c>'), extractor.found
+    (True, {'a': '', 'b': '1'})
+    """
+
+    def __init__(self, tags):
+        self._wanted = {tag: tag.split('/') for tag in tags}
+        self._path = []
+        self._parser = XMLPullParser(events=('start', 'end'))
+        self.found = {}
+
+    def feed(self, data):
+        """Parse next chunk of document, return True when all tags are found."""
+        if len(self.found) == len(self._wanted):
+            return True
+        self._parser.feed(data)
+        for event, element in self._parser.read_events():
+            if event == 'start':
+                self._path.append(element.tag.rsplit('}', 1)[-1])
+                if len(self._path) == 1 and self._path[0] in self._wanted:
+                    self.found[self._path[0]] = ''
+            else:
+                for tag, parts in self._wanted.items():
+                    if tag not in self.found and self._path[-len(parts):] == parts:
+                        self.found[tag] = (element.text or '').strip()
+                self._path.pop()
+                element.clear()
+            if len(self.found) == len(self._wanted):
+                return True
+        return False
+
+
+def update_fields(parsed, data):
+    """Update parsed status fields {id: field} from StoredVehicleDataResponse data, return set of changed ids.
+    Fields are compared by value, entries with unchanged value are kept. Fields without value are stored as ''.
+
+    >>> parsed = {}
+    >>> sorted(update_fields(parsed, [{'field': [{'id': 'a', 'value': '1'}, {'id': 'b'}]}]))
+    ['a', 'b']
+    >>> update_fields(parsed, [{'field': [{'id': 'a', 'value': '2'}, {'id': 'b'}]}])
+    {'a'}
+    >>> update_fields(parsed, [{'field': [{'id': 'a', 'value': '2'}]}]), parsed
+    ({'b'}, {'a': {'id': 'a', 'value': '2'}})
+    """
+    changed = set()
+    seen = set()
+    for group in data:
+        for field in group.get('field', []):
+            fid = field.get('id', None)
+            seen.add(fid)
+            previous = parsed.get(fid, None)
+            if 'value' in field:
+                if isinstance(previous, dict) and previous.get('value', None) == field['value']:
+                    continue
+                parsed[fid] = field
+            elif previous == '':
+                continue
+            else:
+                parsed[fid] = ''
+            changed.add(fid)
+    for fid in [fid for fid in parsed if fid not in seen]:
+        del parsed[fid]
+        changed.add(fid)
+    return changed
+
+
+def html_parse(text):
+    """Parse HTML document with lxml."""
+    return lxml_html.fromstring(text)
+
+
+def html_form(document, form_id):
+    """Return action and hidden input fields of form with given id, None if form is missing.
+
+    >>> html_form(html_parse('<form id="f" action="/a"><input type="hidden" name="n" value="v"/></form>'), 'f')
+    ('/a', {'n': 'v'})
+    """
+    forms = document.xpath('//form[@id=$form_id]', form_id=form_id)
+    if not forms:
+        return None
+    fields = {
+        field.get('name'): field.get('value', '')
+        for field in forms[0].xpath('.//input[@type="hidden"][@name]')
+    }
+    return forms[0].get('action'), fields
+
+
+def html_inline_scripts(document):
+    """Return content of all inline script elements.
+
+    >>> html_inline_scripts(html_parse('<p>x</p><script src="s.js"></script><script>var a = 1;</script>'))
+    ['var a = 1;']
+    """
+    return [script.text or '' for script in document.xpath('//script[not(@src)]')]
+
+
 def find_path(src, path):
     """Simple navigation of a hierarchical dict structure using XPATH-like syntax.
 
@@ -11,6 +11,8 @@ from datetime import datetime, timedelta, timezone
 from json import dumps as to_json
 from collections import OrderedDict
 from seatconnect.utilities import find_path, is_valid_path
+from seatconnect.models import StatusReport, Charger, Climater, Heater, Position
+from seatconnect.const import POLL_INTERVALS, POLL_ACTIVE, POLL_TRIGGERS
 from seatconnect.exceptions import (
     SeatConfigException,
     SeatException,
@@ -37,8 +39,25 @@ class Vehicle:
         self._modelimagel = None
         self._modelimages = None
         self._discovered = False
+        self._discovery_task = None
         self._dashboard = None
         self._states = {}
+        self._realcar = {}
+        # Ids of status report fields changed by the last status report
+        self._status_changed = set()
+        # Decoded status report fields, rebuilt when a status report changes
+        self._status = StatusReport()
+        # Decoded endpoint data, raw payloads are kept in _states unless compact state is enabled
+        self._charger = Charger()
+        self._climater = Climater()
+        self._heater = Heater()
+        self._position = Position()
+        # Incremented when vehicle data has been updated, used to cache derived data such as dashboard support
+        self._state_version = 0
+        # When endpoints were last fetched, {endpoint: datetime}, used with polling intervals
+        self._polled = {}
+        # Outcome of last update per endpoint, {endpoint: True, False, None or exception}
+        self._endpoint_results = {}
 
         self._requests = {
             'departuretimer': {'status': '', 'timestamp': DATEZERO},
@@ -71,18 +90,19 @@ class Vehicle:
   # Init and update vehicle data
     async def discover(self):
         """Discover vehicle and initial data."""
-        homeregion = await self._connection.getHomeRegion(self.vin)
-        _LOGGER.debug(f'Get homeregion for VIN {self.vin}')
-        if homeregion:
-            self._apibase = homeregion.split('/api')[0].replace('mal-', 'fal-') if 'mal-3a' in homeregion else 'https://msg.volkswagen.de'
-            self._secbase = homeregion.split('/api')[0]
-
-        await asyncio.gather(
+        # Only the operation list depends on home region, everything else is fetched concurrently
+        _LOGGER.debug(f'Attempting discovery of supported API endpoints for {self.vin}.')
+        results = await asyncio.gather(
+            self.get_operationlist(),
             self.get_realcardata(),
+            self.get_modelimageurl(size='L'),
+            self.get_modelimageurl(size='S'),
             return_exceptions=True
         )
-        _LOGGER.debug(f'Attempting discovery of supported API endpoints for {self.vin}.')
-        operationList = await self._connection.getOperationList(self.vin, self._secbase)
+        for result in results:
+            if isinstance(result, Exception):
+                _LOGGER.debug(f'Discovery step for {self.vin} failed, error: {result}')
+        operationList, _, modelimagel, modelimages = [None if isinstance(result, Exception) else result for result in results]
         if operationList:
             serviceInfo = operationList['serviceInfo']
             # Iterate over all endpoints in ServiceInfo list
@@ -120,81 +140,221 @@ class Vehicle:
                 if endpoint.get('active', False):
                     _LOGGER.debug(f'API endpoint "{endpointName}" valid until {endpoint.get("expiration").strftime("%Y-%m-%d %H:%M:%S")} - operations: {endpoint.get("operations", [])}')
 
-         # Get URLs for model image
-        self._modelimagel = await self.get_modelimageurl(size='L')
-        self._modelimages = await self.get_modelimageurl(size='S')
+        self._modelimagel = modelimagel
+        self._modelimages = modelimages
 
         self._discovered = datetime.now()
+        self._state_version += 1
+        if self._connection._discovery_cache is not None:
+            await self._connection._discovery_cache.set(self.vin, self._discovery_entry())
+
+    def _discovery_entry(self):
+        """Return discovery results to store in cache."""
+        return {
+            'apibase': self._apibase,
+            'secbase': self._secbase,
+            'services': self._services,
+            'modelimagel': self._modelimagel,
+            'modelimages': self._modelimages,
+            'realcar': self._realcar or None
+        }
+
+    def restore(self):
+        """Restore discovery results from cache, return True if vehicle was restored."""
+        if self._connection._discovery_cache is None:
+            return False
+        entry = self._connection._discovery_cache.get(self.vin)
+        if not entry or not entry.get('services'):
+            return False
+        self._apibase = entry.get('apibase', self._apibase)
+        self._secbase = entry.get('secbase', self._secbase)
+        for serviceName, service in entry.get('services', {}).items():
+            if serviceName in self._services:
+                self._services[serviceName] = dict(service)
+        self._modelimagel = entry.get('modelimagel', None)
+        self._modelimages = entry.get('modelimages', None)
+        if entry.get('realcar', None) and not self._realcar:
+            self._realcar = entry['realcar']
+        self._discovered = datetime.fromtimestamp(entry.get('discovered', 0))
+        _LOGGER.debug(f'Restored discovery for {self.vin} from cache, discovered {self._discovered}')
+        return True
+
+    async def _rediscover(self):
+        """Run discovery in background, keep using known API endpoints meanwhile."""
+        try:
+            await self.discover()
+        except Exception as error:
+            _LOGGER.warning(f'Rediscovery of {self.vin} failed, error: {error}')
 
     async def update(self):
         """Try to fetch data for all known API endpoints."""
         # Update vehicle information if not discovered or stale information
-        if not self._discovered:
+        if not self._discovered and not self.restore():
             await self.discover()
         else:
-            # Rediscover if data is older than 1 hour
+            # Rediscover in background if data is older than 1 hour
             hourago = datetime.now() - timedelta(hours = 1)
-            if self._discovered < hourago:
-                await self.discover()
+            if self._discovered < hourago and (self._discovery_task is None or self._discovery_task.done()):
+                self._discovery_task = asyncio.ensure_future(self._rediscover())
 
         # Fetch all data if car is not deactivated
+        self._endpoint_results = {}
         if not self.deactivated:
             try:
-                await asyncio.gather(
-                    self.get_preheater(),
-                    self.get_climater(),
-                    self.get_trip_statistic(),
-                    self.get_position(),
-                    self.get_statusreport(),
-                    self.get_charger(),
-                    self.get_timerprogramming(),
+                endpoints = self._due_endpoints()
+                if self._connection._status_first and 'statusreport' in endpoints:
+                    endpoints = await self._status_first(endpoints)
+                now = datetime.now()
+                results = await asyncio.gather(
+                    *[getattr(self, f'get_{endpoint}')() for endpoint in endpoints],
                     return_exceptions=True
                 )
+                self._endpoint_results.update(zip(endpoints, results))
+                # Failed endpoints stay due and are fetched again on next update
+                for endpoint, result in zip(endpoints, results):
+                    if result is True:
+                        self._polled[endpoint] = now
             except:
                 raise SeatException("Update failed")
+            finally:
+                self._state_version += 1
             return True
         else:
             _LOGGER.info(f'Vehicle with VIN {self.vin} is deactivated.')
             return False
         return True
 
+    def _poll_state(self):
+        """Return state used to select polling intervals."""
+        if self.attrs.get('isMoving', False):
+            return 'moving'
+        if self.charging:
+            return 'charging'
+        if self.external_power:
+            return 'external_power'
+        last_connected = self.attrs.get('StoredVehicleDataResponseSentUtc', None)
+        if isinstance(last_connected, str):
+            try:
+                last_connected = datetime.strptime(last_connected, '%Y-%m-%dT%H:%M:%SZ')
+            except ValueError:
+                last_connected = None
+        if isinstance(last_connected, datetime):
+            if last_connected.tzinfo is not None:
+                last_connected = last_connected.astimezone(timezone.utc).replace(tzinfo=None)
+            if datetime.utcnow() - last_connected < timedelta(seconds=POLL_ACTIVE):
+                return 'active'
+        return 'parked'
+
+    def _complete_request(self, section, status):
+        """Store final status of action request, keeping when it was made and recording when it completed."""
+        self._requests[section] = {
+            'timestamp': self._requests.get(section, {}).get('timestamp', datetime.now()),
+            'completed': datetime.now(),
+            'status': status
+        }
+
+    def _requested(self, endpoint):
+        """Return true if an action request for endpoint completed after endpoint was last fetched."""
+        polled = self._polled.get(endpoint, DATEZERO)
+        return any(
+            self._requests.get(section, {}).get('completed', DATEZERO) > polled
+            for section in POLL_TRIGGERS.get(endpoint, ())
+        )
+
+    def _due_endpoints(self):
+        """Return endpoints to fetch, all unless polling intervals are enabled."""
+        endpoints = list(POLL_INTERVALS)
+        intervals = self._connection._poll_intervals
+        if not intervals:
+            return endpoints
+        now = datetime.now()
+        state = self._poll_state()
+        due = []
+        for endpoint in endpoints:
+            interval = timedelta(seconds=intervals.get(endpoint, {}).get(state, 0))
+            # Fetch data as soon as an action request has been made for the endpoint
+            if now - self._polled.get(endpoint, DATEZERO) >= interval or self._requested(endpoint):
+                due.append(endpoint)
+        _LOGGER.debug(f'Vehicle {self.vin} is {state}, due endpoints: {", ".join(due) or "none"}')
+        return due
+
+    async def _status_first(self, endpoints):
+        """Fetch status report, return the other endpoints only if car has sent data since last update.
+        Endpoints are still fetched if older than max staleness, after an action request or if the status report failed."""
+        previous = self.attrs.get('StoredVehicleDataResponseSentUtc', None)
+        now = datetime.now()
+        try:
+            self._endpoint_results['statusreport'] = await self.get_statusreport()
+        except Exception as error:
+            self._endpoint_results['statusreport'] = error
+        if self._endpoint_results['statusreport'] is True:
+            self._polled['statusreport'] = now
+        sent = self.attrs.get('StoredVehicleDataResponseSentUtc', None)
+        endpoints = [endpoint for endpoint in endpoints if endpoint != 'statusreport']
+        # Without a fresh status report it is unknown if the car has sent data, fetch all due endpoints
+        if self._endpoint_results['statusreport'] is not True or sent is None or sent != previous:
+            return endpoints
+        now = datetime.now()
+        staleness = timedelta(seconds=self._connection._max_staleness)
+        fetch = [
+            endpoint for endpoint in endpoints
+            if now - self._polled.get(endpoint, DATEZERO) >= staleness or self._requested(endpoint)
+        ]
+        _LOGGER.debug(f'Vehicle {self.vin} has not sent data since {sent}, skipping {", ".join(set(endpoints) - set(fetch)) or "no endpoints"}')
+        return fetch
+
   # Data collection functions
+    async def get_operationlist(self):
+        """Fetch home region and then the list of licensed services from it."""
+        homeregion = await self._connection.getHomeRegion(self.vin)
+        _LOGGER.debug(f'Get homeregion for VIN {self.vin}')
+        if homeregion:
+            self._apibase = homeregion.split('/api')[0].replace('mal-', 'fal-') if 'mal-3a' in homeregion else 'https://msg.volkswagen.de'
+            self._secbase = homeregion.split('/api')[0]
+        return await self._connection.getOperationList(self.vin, self._secbase)
+
     async def get_modelimageurl(self, size='L'):
         """Fetch the URL for model image."""
         return await self._connection.getModelImageURL(self.vin, size)
 
     async def get_realcardata(self):
-        """Fetch realcar data."""
-        data = await self._connection.getRealCarData()
-        if data:
-            self._states.update(data)
+        """Fetch realcar data, shared by all vehicles of the account."""
+        realcars = await self._connection.getRealCars()
+        if realcars:
+            self._realcar = realcars.get(self.vin, {})
 
     async def get_preheater(self):
-        """Fetch pre-heater data if function is enabled."""
+        """Fetch pre-heater data if function is enabled, return True if data was fetched."""
         if self._services.get('rheating_v1', {}).get('active', False):
             if not await self.expired('rheating_v1'):
                 data = await self._connection.getPreHeater(self.vin, self._apibase)
                 if data:
-                    self._states.update(data)
+                    self._heater = self._update_state(data, 'heating', Heater)
                 else:
                     _LOGGER.debug('Could not fetch preheater data')
+                    return False
+                return True
         else:
             self._requests.pop('preheater', None)
 
     async def get_climater(self):
-        """Fetch climater data if function is enabled."""
+        """Fetch climater data if function is enabled, return True if data was fetched."""
         if self._services.get('rclima_v1', {}).get('active', False):
             if not await self.expired('rclima_v1'):
                 data = await self._connection.getClimater(self.vin, self._apibase)
-                if data:
-                    self._states.update(data)
+                if data is True:
+                    _LOGGER.debug('Climater data unchanged')
+                elif data:
+                    self._climater = self._update_state(data, 'climater', Climater)
                 else:
                     _LOGGER.debug('Could not fetch climater data')
+                    return False
+                return True
         else:
             self._requests.pop('climatisation', None)
 
     async def get_trip_statistic(self):
-        """Fetch trip data if function is enabled."""
+        """Fetch trip data if function is enabled, return True if data was fetched."""
         if self._services.get('trip_statistic_v1', {}).get('active', False):
             if not await self.expired('trip_statistic_v1'):
                 data = await self._connection.getTripStatistics(self.vin, self._apibase)
@@ -202,9 +362,11 @@ class Vehicle:
                     self._states.update(data)
                 else:
                     _LOGGER.debug('Could not fetch trip statistics')
+                    return False
+                return True
 
     async def get_position(self):
-        """Fetch position data if function is enabled."""
+        """Fetch position data if function is enabled, return True if data was fetched."""
         if self._services.get('carfinder_v1', {}).get('active', False):
             if not await self.expired('carfinder_v1'):
                 data = await self._connection.getPosition(self.vin, self._apibase)
@@ -213,37 +375,52 @@ class Vehicle:
                     if data.get('findCarResponse', {}).get('parkingTimeUTC', False):
                         try:
                             newTime = data.get('findCarResponse').get('parkingTimeUTC')
-                            oldTime = self.attrs.get('findCarResponse').get('parkingTimeUTC')
+                            oldTime = self._position.parking_time
                             if newTime > oldTime:
                                 self.requests_remaining = 15
                         except:
                             pass
-                    self._states.update(data)
+                    # Position is not reported while moving, keep last known position
+                    if 'findCarResponse' in data:
+                        self._position = self._update_state(data, 'findCarResponse', Position)
+                    else:
+                        self._states.update(data)
                 else:
                     _LOGGER.debug('Could not fetch any positional data')
+                    return False
+                return True
 
     async def get_statusreport(self):
-        """Fetch status data if function is enabled."""
+        """Fetch status data if function is enabled, return True if data was fetched."""
         if self._services.get('statusreport_v1', {}).get('active', False):
             if not await self.expired('statusreport_v1'):
-                data = await self._connection.getVehicleStatusReport(self.vin, self._apibase)
+                data = await self._connection.getVehicleStatusReport(self.vin, self._apibase, self._states.get('StoredVehicleDataResponseParsed', None))
                 if data:
+                    self._status_changed = data.pop('changed', set())
                     self._states.update(data)
+                    if self._status_changed:
+                        self._status = StatusReport(data.get('StoredVehicleDataResponseParsed', {}))
                 else:
                     _LOGGER.debug('Could not fetch status report')
+                    return False
+                return True
 
     async def get_charger(self):
-        """Fetch charger data if function is enabled."""
+        """Fetch charger data if function is enabled, return True if data was fetched."""
         if self._services.get('rbatterycharge_v1', {}).get('active', False):
             if not await self.expired('rbatterycharge_v1'):
                 data = await self._connection.getCharger(self.vin, self._apibase)
-                if data:
-                    self._states.update(data)
+                if data is True:
+                    _LOGGER.debug('Charger data unchanged')
+                elif data:
+                    self._charger = self._update_state(data, 'charger', Charger)
                 else:
                     _LOGGER.debug('Could not fetch charger data')
+                    return False
+                return True
 
     async def get_timerprogramming(self):
-        """Fetch timer data if function is enabled."""
+        """Fetch timer data if function is enabled, return True if data was fetched."""
         if self._services.get('timerprogramming_v1', {}).get('active', False):
             if not await self.expired('timerprogramming_v1'):
                 data = await self._connection.getDeparturetimer(self.vin, self._apibase)
@@ -251,26 +428,26 @@ class Vehicle:
                     self._states.update(data)
                 else:
                     _LOGGER.debug('Could not fetch timers')
+                    return False
+                return True
 
-    async def wait_for_request(self, section, request, retryCount=36):
-        """Update status of outstanding requests."""
-        retryCount -= 1
-        if (retryCount == 0):
-            _LOGGER.info(f'Timeout while waiting for result of {request}.')
-            return 'Timeout'
-        try:
-            status = await self._connection.get_request_status(self.vin, section, request, self._apibase)
-            _LOGGER.info(f'Request for {section} with ID {request}: {status}')
-            if status == 'In progress':
-                self._requests['state'] = 'In progress'
-                await asyncio.sleep(5)
-                return await self.wait_for_request(section, request, retryCount)
-            else:
-                self._requests['state'] = status
-                return status
-        except Exception as error:
-            _LOGGER.warning(f'Exception encountered while waiting for request status: {error}')
-            return 'Exception'
+    def _update_state(self, data, key, model):
+        """Update states with endpoint data and return model decoded from data[key].
+        With compact state the payload is dropped from states and only kept by the model when debugging."""
+        compact = self._connection._compact_state
+        if compact:
+            self._states.update({name: value for name, value in data.items() if name != key})
+        else:
+            self._states.update(data)
+        return model(data.get(key, None), keep_raw=not compact or self._connection._session_fulldebug)
+
+    async def wait_for_request(self, section, request):
+        """Wait for result of outstanding request."""
+        self._requests['state'] = 'In progress'
+        status = await self._connection.wait_for_request(self.vin, section, request, self._apibase)
+        _LOGGER.info(f'Request for {section} with ID {request}: {status}')
+        self._requests['state'] = status
+        return status
 
   # Data set functions
    # API endpoint charging
@@ -345,7 +522,7 @@ class Vehicle:
                     status = 'Throttled'
                 else:
                     status = await self.wait_for_request('batterycharge', response.get('id', 0))
-                self._requests['batterycharge'] = {'status': status}
+                self._complete_request('batterycharge', status)
                 return True
         except (SeatInvalidRequestException, SeatException):
             raise
@@ -510,7 +687,7 @@ class Vehicle:
                     status = 'Throttled'
                 else:
                     status = await self.wait_for_request('departuretimer', response.get('id', 0))
-                self._requests['departuretimer'] = {'status': status}
+                self._complete_request('departuretimer', status)
                 return True
         except (SeatInvalidRequestException, SeatException):
             raise
@@ -635,7 +812,7 @@ class Vehicle:
                     status = 'Throttled'
                 else:
                     status = await self.wait_for_request('climatisation', response.get('id', 0))
-                self._requests['climatisation'] = {'status': status}
+                self._complete_request('climatisation', status)
                 return True
         except (SeatInvalidRequestException, SeatException):
             raise
@@ -683,7 +860,7 @@ class Vehicle:
                     status = 'Throttled'
                 else:
                     status = await self.wait_for_request('rs', response.get('id', 0))
-                self._requests['preheater'] = {'status': status}
+                self._complete_request('preheater', status)
                 return True
         except (SeatInvalidRequestException, SeatException):
             raise
@@ -728,7 +905,7 @@ class Vehicle:
                     status = 'Throttled'
                 else:
                     status = await self.wait_for_request('rlu', response.get('id', 0))
-                self._requests['lock'] = {'status': status}
+                self._complete_request('lock', status)
                 return True
         except (SeatInvalidRequestException, SeatException):
             raise
@@ -759,9 +936,9 @@ class Vehicle:
         try:
             # Get car position
             if lat is None:
-                lat = int(self.attrs.get('findCarResponse', {}).get('Position', {}).get('carCoordinate', {}).get('latitude', None))
+                lat = int(self._position.latitude)
             if lng is None:
-                lng = int(self.attrs.get('findCarResponse', {}).get('Position', {}).get('carCoordinate', {}).get('longitude', None))
+                lng = int(self._position.longitude)
             if lat is None or lng is None:
                 raise SeatConfigException('No location available, location information is needed for this action')
             data = {
@@ -790,7 +967,7 @@ class Vehicle:
                     status = 'Throttled'
                 else:
                     status = await self.wait_for_request('rhf', response.get('id', 0))
-                self._requests['honkandflash'] = {'status': status}
+                self._complete_request('honkandflash', status)
                 return True
         except (SeatInvalidRequestException, SeatException):
             raise
@@ -830,9 +1007,7 @@ class Vehicle:
                     status = 'Throttled'
                 else:
                     status = await self.wait_for_request('vsr', response.get('id', 0))
-                self._requests['refresh'] = {
-                    'status': status
-                }
+                self._complete_request('refresh', status)
                 return True
         except(SeatInvalidRequestException, SeatException):
             raise
@@ -853,6 +1028,22 @@ class Vehicle:
     def get_attr(self, attr):
         return find_path(self.attrs, attr)
 
+    @property
+    def endpoint_results(self):
+        """Return outcome of last update per endpoint. True if data was fetched, False if the request failed,
+        None if not fetched (service not available) or the exception raised. Endpoints not fetched are left out."""
+        return self._endpoint_results
+
+    @property
+    def state_version(self):
+        """Return version of vehicle data, incremented on every update and discovery."""
+        return self._state_version
+
+    @property
+    def status_changed(self):
+        """Return ids of status report fields that changed with the last status report."""
+        return self._status_changed
+
     async def expired(self, service):
         """Check if access to service has expired. Return true if expired."""
         try:
@@ -868,6 +1059,8 @@ class Vehicle:
             if now >= expiration:
                 _LOGGER.warning(f'Access to {service} has expired!')
                 self._discovered = False
+                if self._connection._discovery_cache is not None:
+                    self._connection._discovery_cache.remove(self.vin)
                 return True
             else:
                 return False
@@ -882,9 +1075,8 @@ class Vehicle:
             from seatconnect.dashboard import Dashboard
             self._dashboard = Dashboard(self, **config)
         elif config != self._dashboard._config:
-            # Init new dashboard on config change
-            from seatconnect.dashboard import Dashboard
-            self._dashboard = Dashboard(self, **config)
+            # Rebind instruments on config change
+            self._dashboard.reconfigure(**config)
         return self._dashboard
 
     @property
@@ -900,29 +1092,23 @@ class Vehicle:
   # Car information
     @property
     def nickname(self):
-        for car in self.attrs.get('realCars', []):
-            if self.vin == car.get('vehicleIdentificationNumber', ''):
-                return car.get('nickname', None)
+        if self._realcar:
+            return self._realcar.get('nickname', None)
 
     @property
     def is_nickname_supported(self):
-        for car in self.attrs.get('realCars', []):
-            if self.vin == car.get('vehicleIdentificationNumber', ''):
-                if car.get('nickname', False):
-                    return True
+        if self._realcar.get('nickname', False):
+            return True
 
     @property
     def deactivated(self):
-        for car in self.attrs.get('realCars', []):
-            if self.vin == car.get('vehicleIdentificationNumber', ''):
-                return car.get('deactivated', False)
+        if self._realcar:
+            return self._realcar.get('deactivated', False)
 
     @property
     def is_deactivated_supported(self):
-        for car in self.attrs.get('realCars', []):
-            if self.vin == car.get('vehicleIdentificationNumber', ''):
-                if car.get('deactivated', False):
-                    return True
+        if self._realcar.get('deactivated', False):
+            return True
 
     @property
     def model(self):
@@ -975,26 +1161,19 @@ class Vehicle:
     @property
     def parking_light(self):
         """Return true if parking light is on"""
-        response = int(self.attrs.get('StoredVehicleDataResponseParsed')['0x0301010001'].get('value', 0))
-        if response != 2:
-            return True
-        else:
-            return False
+        return self._status.parking_light != 2
 
     @property
     def is_parking_light_supported(self):
         """Return true if parking light is supported"""
-        if self.attrs.get('StoredVehicleDataResponseParsed', False):
-            if '0x0301010001' in self.attrs.get('StoredVehicleDataResponseParsed'):
-                return True
-            else:
-                return False
+        if self._status.present:
+            return 'parking_light' in self._status.present
 
   # Connection status
     @property
     def last_connected(self):
         """Return when vehicle was last connected to connect servers."""
-        last_connected_utc = self.attrs.get('StoredVehicleDataResponse').get('vehicleData').get('data')[0].get('field')[0].get('tsCarSentUtc')
+        last_connected_utc = self.attrs.get('StoredVehicleDataResponseSentUtc')
         if isinstance(last_connected_utc, datetime):
             last_connected = last_connected_utc.replace(tzinfo=timezone.utc).astimezone(tz=None)
         else:
@@ -1004,113 +1183,76 @@ class Vehicle:
     @property
     def is_last_connected_supported(self):
         """Return when vehicle was last connected to connect servers."""
-        if next(iter(next(iter(self.attrs.get('StoredVehicleDataResponse', {}).get('vehicleData', {}).get('data', {})), None).get('field', {})), None).get('tsCarSentUtc', []):
+        if self.attrs.get('StoredVehicleDataResponseSentUtc', False):
             return True
 
   # Service information
     @property
     def distance(self):
         """Return vehicle odometer."""
-        value = self.attrs.get('StoredVehicleDataResponseParsed')['0x0101010002'].get('value', 0)
-        return int(value)
+        return self._status.distance or 0
 
     @property
     def is_distance_supported(self):
         """Return true if odometer is supported"""
-        if self.attrs.get('StoredVehicleDataResponseParsed', False):
-            if '0x0101010002' in self.attrs.get('StoredVehicleDataResponseParsed'):
-                return True
-        return False
+        return 'distance' in self._status.present
 
     @property
     def service_inspection(self):
         """Return time left until service inspection"""
-        value = -1
-        value = 0-int(self.attrs.get('StoredVehicleDataResponseParsed', {}).get('0x0203010004',{}).get('value', 0))
-        return int(value)
+        return self._status.service_inspection or 0
 
     @property
     def is_service_inspection_supported(self):
-        if self.attrs.get('StoredVehicleDataResponseParsed', False):
-            if '0x0203010004' in self.attrs.get('StoredVehicleDataResponseParsed'):
-                return True
-        return False
+        return 'service_inspection' in self._status.present
 
     @property
     def service_inspection_distance(self):
         """Return time left until service inspection"""
-        value = -1
-        value = 0-int(self.attrs.get('StoredVehicleDataResponseParsed')['0x0203010003'].get('value', 0))
-        return int(value)
+        return self._status.service_inspection_distance or 0
 
     @property
     def is_service_inspection_distance_supported(self):
-        if self.attrs.get('StoredVehicleDataResponseParsed', False):
-            if '0x0203010003' in self.attrs.get('StoredVehicleDataResponseParsed'):
-                return True
-        return False
+        return 'service_inspection_distance' in self._status.present
 
     @property
     def oil_inspection(self):
         """Return time left until oil inspection"""
-        value = -1
-        value = 0-int(self.attrs.get('StoredVehicleDataResponseParsed', {}).get('0x0203010002', {}).get('value', 0))
-        return int(value)
+        return self._status.oil_inspection or 0
 
     @property
     def is_oil_inspection_supported(self):
-        if self.attrs.get('StoredVehicleDataResponseParsed', False):
-            if '0x0203010002' in self.attrs.get('StoredVehicleDataResponseParsed'):
-                if self.attrs.get('StoredVehicleDataResponseParsed').get('0x0203010002').get('value', None) is not None:
-                    return True
-        return False
+        return self._status.oil_inspection is not None
 
     @property
     def oil_inspection_distance(self):
         """Return distance left until oil inspection"""
-        value = -1
-        value = 0-int(self.attrs.get('StoredVehicleDataResponseParsed')['0x0203010001'].get('value', 0))
-        return int(value)
+        return self._status.oil_inspection_distance or 0
 
     @property
     def is_oil_inspection_distance_supported(self):
-        if self.attrs.get('StoredVehicleDataResponseParsed', False):
-            if '0x0203010001' in self.attrs.get('StoredVehicleDataResponseParsed'):
-                if self.attrs.get('StoredVehicleDataResponseParsed').get('0x0203010001').get('value', None) is not None:
-                    return True
-        return False
+        return self._status.oil_inspection_distance is not None
 
     @property
     def adblue_level(self):
         """Return adblue level."""
-        return int(self.attrs.get('StoredVehicleDataResponseParsed', {}).get('0x02040C0001', {}).get('value', 0))
+        return self._status.adblue_level or 0
 
     @property
     def is_adblue_level_supported(self):
         """Return true if adblue level is supported."""
-        if self.attrs.get('StoredVehicleDataResponseParsed', False):
-            if '0x02040C0001' in self.attrs.get('StoredVehicleDataResponseParsed'):
-                if 'value' in self.attrs.get('StoredVehicleDataResponseParsed')['0x02040C0001']:
-                    if self.attrs.get('StoredVehicleDataResponseParsed')['0x02040C0001'].get('value', 0) is not None:
-                        return True
-        return False
+        return self._status.adblue_level is not None
 
   # Charger related states for EV and PHEV
     @property
     def charging(self):
         """Return battery level"""
-        cstate = self.attrs.get('charger').get('status').get('chargingStatusData').get('chargingState').get('content', '')
-        return 1 if cstate in ['charging', 'Charging'] else 0
+        return 1 if self._charger.charging_state in ['charging', 'Charging'] else 0
 
     @property
     def is_charging_supported(self):
         """Return true if charging is supported"""
-        if self.attrs.get('charger', False):
-            if 'status' in self.attrs.get('charger', {}):
-                if 'chargingStatusData' in self.attrs.get('charger')['status']:
-                    if 'chargingState' in self.attrs.get('charger')['status']['chargingStatusData']:
-                        return True
-        return False
+        return self._charger.charging_state is not None
 
     @property
     def min_charge_level(self):
@@ -1130,26 +1272,18 @@ class Vehicle:
     @property
     def battery_level(self):
         """Return battery level"""
-        if self.attrs.get('charger', False):
-            return int(self.attrs.get('charger').get('status', {}).get('batteryStatusData', {}).get('stateOfCharge', {}).get('content', 0))
-        else:
-            return 0
+        return int(self._charger.state_of_charge or 0)
 
     @property
     def is_battery_level_supported(self):
         """Return true if battery level is supported"""
-        if self.attrs.get('charger', False):
-            if 'status' in self.attrs.get('charger'):
-                if 'batteryStatusData' in self.attrs.get('charger')['status']:
-                    if 'stateOfCharge' in self.attrs.get('charger')['status']['batteryStatusData']:
-                        return True
-        return False
+        return self._charger.state_of_charge is not None
 
     @property
     def charge_max_ampere(self):
         """Return charger max ampere setting."""
-        if self.attrs.get('charger', False):
-            value = int(self.attrs.get('charger').get('settings').get('maxChargeCurrent').get('content'))
+        if self._charger.present:
+            value = int(self._charger.max_charge_current)
             if value == 254:
                 return "Maximum"
             if value == 252:
@@ -1163,47 +1297,27 @@ class Vehicle:
     @property
     def is_charge_max_ampere_supported(self):
         """Return true if Charger Max Ampere is supported"""
-        if self.attrs.get('charger', False):
-            if 'settings' in self.attrs.get('charger', {}):
-                if 'maxChargeCurrent' in self.attrs.get('charger', {})['settings']:
-                    return True
-        return False
+        return self._charger.max_charge_current is not None
 
     @property
     def charging_cable_locked(self):
         """Return plug locked state"""
-        response = ''
-        if self.attrs.get('charger', False):
-            response = self.attrs.get('charger')['status']['plugStatusData']['lockState'].get('content', 0)
-        return True if response in ['Locked', 'locked'] else False
+        return True if self._charger.plug_lock_state in ['Locked', 'locked'] else False
 
     @property
     def is_charging_cable_locked_supported(self):
         """Return true if plug locked state is supported"""
-        if self.attrs.get('charger', False):
-            if 'status' in self.attrs.get('charger', {}):
-                if 'plugStatusData' in self.attrs.get('charger').get('status', {}):
-                    if 'lockState' in self.attrs.get('charger')['status'].get('plugStatusData', {}):
-                        return True
-        return False
+        return self._charger.plug_lock_state is not None
 
     @property
     def charging_cable_connected(self):
         """Return plug locked state"""
-        response = ''
-        if self.attrs.get('charger', False):
-            response = self.attrs.get('charger', {}).get('status', {}).get('plugStatusData').get('plugState', {}).get('content', 0)
-        return True if response in ['Connected', 'connected'] else False
+        return True if self._charger.plug_state in ['Connected', 'connected'] else False
 
     @property
     def is_charging_cable_connected_supported(self):
         """Return true if charging cable connected is supported"""
-        if self.attrs.get('charger', False):
-            if 'status' in self.attrs.get('charger', {}):
-                if 'plugStatusData' in self.attrs.get('charger').get('status', {}):
-                    if 'plugState' in self.attrs.get('charger')['status'].get('plugStatusData', {}):
-                        return True
-        return False
+        return self._charger.plug_state is not None
 
     @property
     def charging_time_left(self):
@@ -1211,8 +1325,8 @@ class Vehicle:
         if self.external_power:
             if self.attrs.get('charging', {}).get('remainingToCompleteInSeconds', False):
                 minutes = int(self.attrs.get('charging', {}).get('remainingToCompleteInSeconds', 0))/60
-            elif self.attrs.get('charger', {}).get('status', {}).get('batteryStatusData', {}).get('remainingChargingTime', False):
-                minutes = self.attrs.get('charger', {}).get('status', {}).get('batteryStatusData', {}).get('remainingChargingTime', {}).get('content', 0)
+            elif self._charger.remaining_charging_time is not None:
+                minutes = self._charger.remaining_charging_time
             try:
                 if minutes == -1: return '00:00'
                 if minutes == 65535: return '00:00'
@@ -1262,8 +1376,8 @@ class Vehicle:
     def external_power(self):
         """Return true if external power is connected."""
         response = ''
-        if self.attrs.get('charger', False):
-            response = self.attrs.get('charger', {}).get('status', {}).get('chargingStatusData', {}).get('externalPowerSupplyState', {}).get('content', 0)
+        if self._charger.present:
+            response = self._charger.external_power
         elif self.attrs.get('charging', False):
             response = self.attrs.get('charging', {}).get('chargingType', 'Invalid')
             response = 'Charging' if self.attrs.get('charging', {}).get('chargingType', 'Invalid') != 'Invalid' else 'Invalid'
@@ -1272,7 +1386,7 @@ class Vehicle:
     @property
     def is_external_power_supported(self):
         """External power supported."""
-        if self.attrs.get('charger', {}).get('status', {}).get('chargingStatusData', {}).get('externalPowerSupplyState', False):
+        if self._charger.external_power is not None:
             return True
         if self.attrs.get('charging', {}).get('chargingType', False):
             return True
@@ -1280,8 +1394,7 @@ class Vehicle:
     @property
     def energy_flow(self):
         """Return true if energy is flowing through charging port."""
-        check = self.attrs.get('charger', {}).get('status', {}).get('chargingStatusData', {}).get('energyFlow', {}).get('content', 'off')
-        if check == 'on':
+        if self._charger.energy_flow == 'on':
             return True
         else:
             return False
@@ -1289,7 +1402,7 @@ class Vehicle:
     @property
     def is_energy_flow_supported(self):
         """Energy flow supported."""
-        if self.attrs.get('charger', {}).get('status', {}).get('chargingStatusData', {}).get('energyFlow', False):
+        if self._charger.energy_flow is not None:
             return True
 
   # Vehicle location states
@@ -1305,10 +1418,9 @@ class Vehicle:
                     'timestamp': None
                 }
             else:
-                posObj = self.attrs.get('findCarResponse', {})
-                lat = int(posObj.get('Position').get('carCoordinate').get('latitude'))/1000000
-                lng = int(posObj.get('Position').get('carCoordinate').get('longitude'))/1000000
-                parkingTime = posObj.get('parkingTimeUTC')
+                lat = int(self._position.latitude)/1000000
+                lng = int(self._position.longitude)/1000000
+                parkingTime = self._position.parking_time
                 output = {
                     'lat' : lat,
                     'lng' : lng,
@@ -1344,7 +1456,7 @@ class Vehicle:
     @property
     def parking_time(self):
         """Return timestamp of last parking time."""
-        parkTime_utc = self.attrs.get('findCarResponse', {}).get('parkingTimeUTC', 'Unknown')
+        parkTime_utc = self._position.parking_time or 'Unknown'
         if isinstance(parkTime_utc, datetime):
             parkTime = parkTime_utc.replace(tzinfo=timezone.utc).astimezone(tz=None)
         else:
@@ -1354,73 +1466,45 @@ class Vehicle:
     @property
     def is_parking_time_supported(self):
         """Return true if vehicle parking timestamp is supported."""
-        if 'parkingTimeUTC' in self.attrs.get('findCarResponse', {}):
+        if self._position.parking_time is not None:
             return True
 
   # Vehicle fuel level and range
     @property
     def primary_range(self):
-        value = -1
-        if '0x0301030006' in self.attrs.get('StoredVehicleDataResponseParsed'):
-            if 'value' in self.attrs.get('StoredVehicleDataResponseParsed')['0x0301030006']:
-                value = self.attrs.get('StoredVehicleDataResponseParsed')['0x0301030006'].get('value', 0)
-        return int(value)
+        value = self._status.primary_range
+        return value if value is not None else -1
 
     @property
     def is_primary_range_supported(self):
-        if self.attrs.get('StoredVehicleDataResponseParsed', False):
-            if '0x0301030006' in self.attrs.get('StoredVehicleDataResponseParsed'):
-                if 'value' in self.attrs.get('StoredVehicleDataResponseParsed')['0x0301030006']:
-                    return True
-        return False
+        return self._status.primary_range is not None
 
     @property
     def primary_drive(self):
-        value = -1
-        if '0x0301030007' in self.attrs.get('StoredVehicleDataResponseParsed'):
-            if 'value' in self.attrs.get('StoredVehicleDataResponseParsed')['0x0301030007']:
-                value = self.attrs.get('StoredVehicleDataResponseParsed')['0x0301030007'].get('value', 0)
-        return int(value)
+        value = self._status.primary_drive
+        return value if value is not None else -1
 
     @property
     def is_primary_drive_supported(self):
-        if self.attrs.get('StoredVehicleDataResponseParsed', False):
-            if '0x0301030007' in self.attrs.get('StoredVehicleDataResponseParsed'):
-                if 'value' in self.attrs.get('StoredVehicleDataResponseParsed')['0x0301030007']:
-                    return True
-        return False
+        return self._status.primary_drive is not None
 
     @property
     def secondary_range(self):
-        value = -1
-        if '0x0301030008' in self.attrs.get('StoredVehicleDataResponseParsed'):
-            if 'value' in self.attrs.get('StoredVehicleDataResponseParsed')['0x0301030008']:
-                value = self.attrs.get('StoredVehicleDataResponseParsed')['0x0301030008'].get('value', 0)
-        return int(value)
- 
+        value = self._status.secondary_range
+        return value if value is not None else -1
+
     @property
     def is_secondary_range_supported(self):
-        if self.attrs.get('StoredVehicleDataResponseParsed', False):
-            if '0x0301030008' in self.attrs.get('StoredVehicleDataResponseParsed'):
-                if 'value' in self.attrs.get('StoredVehicleDataResponseParsed')['0x0301030008']:
-                    return True
-        return False
+        return self._status.secondary_range is not None
 
     @property
     def secondary_drive(self):
-        value = -1
-        if '0x0301030009' in self.attrs.get('StoredVehicleDataResponseParsed'):
-            if 'value' in self.attrs.get('StoredVehicleDataResponseParsed')['0x0301030009']:
-                value = self.attrs.get('StoredVehicleDataResponseParsed')['0x0301030009'].get('value', 0)
-        return int(value)
- 
+        value = self._status.secondary_drive
+        return value if value is not None else -1
+
     @property
     def is_secondary_drive_supported(self):
-        if self.attrs.get('StoredVehicleDataResponseParsed', False):
-            if '0x0301030009' in self.attrs.get('StoredVehicleDataResponseParsed'):
-                if 'value' in self.attrs.get('StoredVehicleDataResponseParsed')['0x0301030009']:
-                    return True
-        return False
+        return self._status.secondary_drive is not None
 
     @property
     def electric_range(self):
@@ -1466,40 +1550,29 @@ class Vehicle:
 
     @property
     def combined_range(self):
-        value = -1
-        if '0x0301030005' in self.attrs.get('StoredVehicleDataResponseParsed'):
-            if 'value' in self.attrs.get('StoredVehicleDataResponseParsed')['0x0301030005']:
-                value = self.attrs.get('StoredVehicleDataResponseParsed')['0x0301030005'].get('value', 0)
-        return int(value)
+        value = self._status.combined_range
+        return value if value is not None else -1
 
     @property
     def is_combined_range_supported(self):
-        if self.attrs.get('StoredVehicleDataResponseParsed', False):
-            if '0x0301030005' in self.attrs.get('StoredVehicleDataResponseParsed'):
-                return True
-        return False
+        return 'combined_range' in self._status.present
 
     @property
     def fuel_level(self):
-        value = -1
-        if '0x030103000A' in self.attrs.get('StoredVehicleDataResponseParsed'):
-            if 'value' in self.attrs.get('StoredVehicleDataResponseParsed')['0x030103000A']:
-                value = self.attrs.get('StoredVehicleDataResponseParsed')['0x030103000A'].get('value', 0)
-        return int(value)
+        value = self._status.fuel_level
+        return value if value is not None else -1
 
     @property
     def is_fuel_level_supported(self):
-        if self.attrs.get('StoredVehicleDataResponseParsed', False):
-            if '0x030103000A' in self.attrs.get('StoredVehicleDataResponseParsed'):
-                return True
-        return False
+        return 'fuel_level' in self._status.present
 
   # Climatisation settings
     @property
     def climatisation_target_temperature(self):
         """Return the target temperature from climater."""
-        if self.attrs.get('climater', False):
-            value = self.attrs.get('climater').get('settings', {}).get('targetTemperature', {}).get('content', 2730)
+        value = None
+        if self._climater.present:
+            value = self._climater.target_temperature if self._climater.target_temperature is not None else 2730
         if value:
             reply = float((value / 10) - 273)
             return reply
@@ -1507,11 +1580,7 @@ class Vehicle:
     @property
     def is_climatisation_target_temperature_supported(self):
         """Return true if climatisation target temperature is supported."""
-        if self.attrs.get('climater', False):
-            if 'settings' in self.attrs.get('climater', {}):
-                if 'targetTemperature' in self.attrs.get('climater', {})['settings']:
-                    return True
-        return False
+        return self._climater.target_temperature is not None
 
     @property
     def climatisation_time_left(self):
@@ -1536,46 +1605,32 @@ class Vehicle:
     @property
     def climatisation_without_external_power(self):
         """Return state of climatisation from battery power."""
-        return self.attrs.get('climater').get('settings').get('climatisationWithoutHVpower').get('content', False)
+        value = self._climater.without_hv_power
+        return value if value is not None else False
 
     @property
     def is_climatisation_without_external_power_supported(self):
         """Return true if climatisation on battery power is supported."""
-        if self.attrs.get('climater', False):
-            if 'settings' in self.attrs.get('climater', {}):
-                if 'climatisationWithoutHVpower' in self.attrs.get('climater', {})['settings']:
-                    return True
-            else:
-                return False
+        return self._climater.without_hv_power is not None
 
     @property
     def outside_temperature(self):
         """Return outside temperature."""
-        response = int(self.attrs.get('StoredVehicleDataResponseParsed')['0x0301020001'].get('value', 0))
-        if response:
-            return round(float((response / 10) - 273.15), 1)
-        else:
-            return False
+        value = self._status.outside_temperature
+        return value if value is not None else False
 
     @property
     def is_outside_temperature_supported(self):
         """Return true if outside temp is supported"""
-        if self.attrs.get('StoredVehicleDataResponseParsed', False):
-            if '0x0301020001' in self.attrs.get('StoredVehicleDataResponseParsed'):
-                if "value" in self.attrs.get('StoredVehicleDataResponseParsed')['0x0301020001']:
-                    return True
-                else:
-                    return False
-            else:
-                return False
+        return self._status.outside_temperature is not None
 
   # Climatisation, electric
     @property
     def electric_climatisation_attributes(self):
         """Return climatisation attributes."""
         data = {
-            'source': self.attrs.get('climater', {}).get('settings', {}).get('heaterSource', {}).get('content', ''),
-            'status': self.attrs.get('climater', {}).get('status', {}).get('climatisationStatusData', {}).get('climatisationState', {}).get('content', '')
+            'source': self._climater.heater_source or '',
+            'status': self._climater.climatisation_state or ''
         }
         return data
 
@@ -1587,9 +1642,9 @@ class Vehicle:
     @property
     def electric_climatisation(self):
         """Return status of climatisation."""
-        if self.attrs.get('climater', {}).get('status', {}).get('climatisationStatusData', {}).get('climatisationState', {}).get('content', False):
-            climatisation_type = self.attrs.get('climater', {}).get('settings', {}).get('heaterSource', {}).get('content', '')
-            status = self.attrs.get('climater', {}).get('status', {}).get('climatisationStatusData', {}).get('climatisationState', {}).get('content', '')
+        if self._climater.climatisation_state:
+            climatisation_type = self._climater.heater_source or ''
+            status = self._climater.climatisation_state
             if status in ['heating', 'cooling', 'on'] and climatisation_type == 'electric':
                 return True
         return False
@@ -1602,8 +1657,8 @@ class Vehicle:
     @property
     def auxiliary_climatisation(self):
         """Return status of auxiliary climatisation."""
-        climatisation_type = self.attrs.get('climater', {}).get('settings', {}).get('heaterSource', {}).get('content', '')
-        status = self.attrs.get('climater', {}).get('status', {}).get('climatisationStatusData', {}).get('climatisationState', {}).get('content', '')
+        climatisation_type = self._climater.heater_source or ''
+        status = self._climater.climatisation_state or ''
         if status in ['heating', 'cooling', 'ventilation', 'heatingAuxiliary', 'on'] and climatisation_type == 'auxiliary':
             return True
         elif status in ['heatingAuxiliary'] and climatisation_type == 'electric':
@@ -1625,31 +1680,25 @@ class Vehicle:
     @property
     def is_climatisation_supported(self):
         """Return true if climatisation has State."""
-        if self.attrs.get('climater', {}).get('status', {}).get('climatisationStatusData', {}).get('climatisationState', {}).get('content', False):
+        if self._climater.climatisation_state:
             return True
         return False
 
     @property
     def window_heater(self):
         """Return status of window heater."""
-        if self.attrs.get('climater', False):
-            status_front = self.attrs.get('climater', {}).get('status', {}).get('windowHeatingStatusData', {}).get('windowHeatingStateFront', {}).get('content', '')
-            if status_front == 'on':
-                return True
-            status_rear = self.attrs.get('climater', {}).get('status', {}).get('windowHeatingStatusData', {}).get('windowHeatingStateRear', {}).get('content', '')
-            if status_rear == 'on':
-                return True
+        if self._climater.window_heating_front == 'on' or self._climater.window_heating_rear == 'on':
+            return True
         return False
 
     @property
     def is_window_heater_supported(self):
         """Return true if vehichle has heater."""
         if self.is_electric_climatisation_supported:
-            if self.attrs.get('climater', False):
-                if self.attrs.get('climater', {}).get('status', {}).get('windowHeatingStatusData', {}).get('windowHeatingStateFront', {}).get('content', '') in ['on', 'off']:
-                    return True
-                if self.attrs.get('climater', {}).get('status', {}).get('windowHeatingStatusData', {}).get('windowHeatingStateRear', {}).get('content', '') in ['on', 'off']:
-                    return True
+            if self._climater.window_heating_front in ['on', 'off']:
+                return True
+            if self._climater.window_heating_rear in ['on', 'off']:
+                return True
         return False
 
     @property
@@ -1687,7 +1736,7 @@ class Vehicle:
     @property
     def pheater_ventilation(self):
         """Return status of combustion climatisation."""
-        return self.attrs.get('heating', {}).get('climatisationStateReport', {}).get('climatisationState', False) == 'ventilation'
+        return self._heater.climatisation_state == 'ventilation'
 
     @property
     def is_pheater_ventilation_supported(self):
@@ -1697,23 +1746,23 @@ class Vehicle:
     @property
     def pheater_heating(self):
         """Return status of combustion engine heating."""
-        return self.attrs.get('heating', {}).get('climatisationStateReport', {}).get('climatisationState', False) == 'heating'
+        return self._heater.climatisation_state == 'heating'
 
     @property
     def is_pheater_heating_supported(self):
         """Return true if vehichle has combustion engine heating."""
-        if self.attrs.get('heating', {}).get('climatisationStateReport', {}).get('climatisationState', False):
+        if self._heater.climatisation_state:
             return True
 
     @property
     def pheater_status(self):
         """Return status of combustion engine heating/ventilation."""
-        return self.attrs.get('heating', {}).get('climatisationStateReport', {}).get('climatisationState', 'Unknown')
+        return self._heater.climatisation_state or 'Unknown'
 
     @property
     def is_pheater_status_supported(self):
         """Return true if vehichle has combustion engine heating/ventilation."""
-        if self.attrs.get('heating', {}).get('climatisationStateReport', {}).get('climatisationState', False):
+        if self._heater.climatisation_state:
             return True
 
   # Windows
@@ -1724,246 +1773,126 @@ class Vehicle:
     @property
     def is_windows_closed_supported(self):
         """Return true if window state is supported"""
-        response = 0
-        if self.attrs.get('StoredVehicleDataResponseParsed', False):
-            if '0x0301050001' in self.attrs.get('StoredVehicleDataResponseParsed'):
-                response = int(self.attrs.get('StoredVehicleDataResponseParsed')['0x0301050001'].get('value', 0))
-        return True if response != 0 else False
+        return True if self._status.window_closed_left_front else False
 
     @property
     def window_closed_left_front(self):
-        response = int(self.attrs.get('StoredVehicleDataResponseParsed')['0x0301050001'].get('value', 0))
-        if response == 3:
-            return True
-        else:
-            return False
+        return self._status.window_closed_left_front == 3
 
     @property
     def is_window_closed_left_front_supported(self):
         """Return true if window state is supported"""
-        response = 0
-        if self.attrs.get('StoredVehicleDataResponseParsed', False):
-            if '0x0301050001' in self.attrs.get('StoredVehicleDataResponseParsed'):
-                response = int(self.attrs.get('StoredVehicleDataResponseParsed')['0x0301050001'].get('value', 0))
-        return True if response != 0 else False
+        return True if self._status.window_closed_left_front else False
 
     @property
     def window_closed_right_front(self):
-        response = int(self.attrs.get('StoredVehicleDataResponseParsed')['0x0301050005'].get('value', 0))
-        if response == 3:
-            return True
-        else:
-            return False
+        return self._status.window_closed_right_front == 3
 
     @property
     def is_window_closed_right_front_supported(self):
         """Return true if window state is supported"""
-        response = 0
-        if self.attrs.get('StoredVehicleDataResponseParsed', False):
-            if '0x0301050005' in self.attrs.get('StoredVehicleDataResponseParsed'):
-                response = int(self.attrs.get('StoredVehicleDataResponseParsed')['0x0301050005'].get('value', 0))
-        return True if response != 0 else False
+        return True if self._status.window_closed_right_front else False
 
     @property
     def window_closed_left_back(self):
-        response = int(self.attrs.get('StoredVehicleDataResponseParsed')['0x0301050003'].get('value', 0))
-        if response == 3:
-            return True
-        else:
-            return False
+        return self._status.window_closed_left_back == 3
 
     @property
     def is_window_closed_left_back_supported(self):
         """Return true if window state is supported"""
-        response = 0
-        if self.attrs.get('StoredVehicleDataResponseParsed', False):
-            if '0x0301050003' in self.attrs.get('StoredVehicleDataResponseParsed'):
-                response = int(self.attrs.get('StoredVehicleDataResponseParsed')['0x0301050003'].get('value', 0))
-        return True if response != 0 else False
+        return True if self._status.window_closed_left_back else False
 
     @property
     def window_closed_right_back(self):
-        response = int(self.attrs.get('StoredVehicleDataResponseParsed')['0x0301050007'].get('value', 0))
-        if response == 3:
-            return True
-        else:
-            return False
+        return self._status.window_closed_right_back == 3
 
     @property
     def is_window_closed_right_back_supported(self):
         """Return true if window state is supported"""
-        response = 0
-        if self.attrs.get('StoredVehicleDataResponseParsed', False):
-            if '0x0301050007' in self.attrs.get('StoredVehicleDataResponseParsed'):
-                response = int(self.attrs.get('StoredVehicleDataResponseParsed')['0x0301050007'].get('value', 0))
-        return True if response != 0 else False
+        return True if self._status.window_closed_right_back else False
 
     @property
     def sunroof_closed(self):
-        response = int(self.attrs.get('StoredVehicleDataResponseParsed')['0x030105000B'].get('value', 0))
-        if response == 3:
-            return True
-        else:
-            return False
+        return self._status.sunroof_closed == 3
 
     @property
     def is_sunroof_closed_supported(self):
         """Return true if sunroof state is supported"""
-        response = 0
-        if self.attrs.get('StoredVehicleDataResponseParsed', False):
-            if '0x030105000B' in self.attrs.get('StoredVehicleDataResponseParsed'):
-                response = int(self.attrs.get('StoredVehicleDataResponseParsed')['0x030105000B'].get('value', 0))
-        return True if response != 0 else False
+        return True if self._status.sunroof_closed else False
 
   # Locks
     @property
     def door_locked(self):
-        # LEFT FRONT
-        response = int(self.attrs.get('StoredVehicleDataResponseParsed')['0x0301040001'].get('value', 0))
-        if response != 2:
-            return False
-        # LEFT REAR
-        response = int(self.attrs.get('StoredVehicleDataResponseParsed')['0x0301040004'].get('value', 0))
-        if response != 2:
-            return False
-        # RIGHT FRONT
-        response = int(self.attrs.get('StoredVehicleDataResponseParsed')['0x0301040007'].get('value', 0))
-        if response != 2:
-            return False
-        # RIGHT REAR
-        response = int(self.attrs.get('StoredVehicleDataResponseParsed')['0x030104000A'].get('value', 0))
-        if response != 2:
-            return False
-
-        return True
+        status = self._status
+        return status.door_locked_left_front == 2 and status.door_locked_left_back == 2 and status.door_locked_right_front == 2 and status.door_locked_right_back == 2
 
     @property
     def is_door_locked_supported(self):
-        response = 0
-        if self.attrs.get('StoredVehicleDataResponseParsed', False):
-            if '0x0301040001' in self.attrs.get('StoredVehicleDataResponseParsed'):
-                response = int(self.attrs.get('StoredVehicleDataResponseParsed')['0x0301040001'].get('value', 0))
-        return True if response != 0 else False
+        return True if self._status.door_locked_left_front else False
 
     @property
     def trunk_locked(self):
-        response = int(self.attrs.get('StoredVehicleDataResponseParsed')['0x030104000D'].get('value', 0))
-        if response == 2:
-            return True
-        else:
-            return False
+        return self._status.trunk_locked == 2
 
     @property
     def is_trunk_locked_supported(self):
-        response = 0
-        if self.attrs.get('StoredVehicleDataResponseParsed', False):
-            if '0x030104000D' in self.attrs.get('StoredVehicleDataResponseParsed'):
-                response = int(self.attrs.get('StoredVehicleDataResponseParsed')['0x030104000D'].get('value', 0))
-        return True if response != 0 else False
+        return True if self._status.trunk_locked else False
 
   # Doors, hood and trunk
     @property
     def hood_closed(self):
         """Return true if hood is closed"""
-        response = int(self.attrs.get('StoredVehicleDataResponseParsed')['0x0301040011'].get('value', 0))
-        if response == 3:
-            return True
-        else:
-            return False
+        return self._status.hood_closed == 3
 
     @property
     def is_hood_closed_supported(self):
         """Return true if hood state is supported"""
-        response = 0
-        if self.attrs.get('StoredVehicleDataResponseParsed', False):
-            if '0x0301040011' in self.attrs.get('StoredVehicleDataResponseParsed', {}):
-                response = int(self.attrs.get('StoredVehicleDataResponseParsed')['0x0301040011'].get('value', 0))
-        return True if response != 0 else False
+        return True if self._status.hood_closed else False
 
     @property
     def door_closed_left_front(self):
-        response = int(self.attrs.get('StoredVehicleDataResponseParsed')['0x0301040002'].get('value', 0))
-        if response == 3:
-            return True
-        else:
-            return False
+        return self._status.door_closed_left_front == 3
 
     @property
     def is_door_closed_left_front_supported(self):
         """Return true if window state is supported"""
-        response = 0
-        if self.attrs.get('StoredVehicleDataResponseParsed', False):
-            if '0x0301040002' in self.attrs.get('StoredVehicleDataResponseParsed'):
-                response = int(self.attrs.get('StoredVehicleDataResponseParsed')['0x0301040002'].get('value', 0))
-        return True if response != 0 else False
+        return True if self._status.door_closed_left_front else False
 
     @property
     def door_closed_right_front(self):
-        response = int(self.attrs.get('StoredVehicleDataResponseParsed')['0x0301040008'].get('value', 0))
-        if response == 3:
-            return True
-        else:
-            return False
+        return self._status.door_closed_right_front == 3
 
     @property
     def is_door_closed_right_front_supported(self):
         """Return true if window state is supported"""
-        response = 0
-        if self.attrs.get('StoredVehicleDataResponseParsed', False):
-            if '0x0301040008' in self.attrs.get('StoredVehicleDataResponseParsed'):
-                response = int(self.attrs.get('StoredVehicleDataResponseParsed')['0x0301040008'].get('value', 0))
-        return True if response != 0 else False
+        return True if self._status.door_closed_right_front else False
 
     @property
     def door_closed_left_back(self):
-        response = int(self.attrs.get('StoredVehicleDataResponseParsed')['0x0301040005'].get('value', 0))
-        if response == 3:
-            return True
-        else:
-            return False
+        return self._status.door_closed_left_back == 3
 
     @property
     def is_door_closed_left_back_supported(self):
         """Return true if window state is supported"""
-        response = 0
-        if self.attrs.get('StoredVehicleDataResponseParsed', False):
-            if '0x0301040005' in self.attrs.get('StoredVehicleDataResponseParsed'):
-                response = int(self.attrs.get('StoredVehicleDataResponseParsed')['0x0301040005'].get('value', 0))
-        return True if response != 0 else False
+        return True if self._status.door_closed_left_back else False
 
     @property
     def door_closed_right_back(self):
-        response = int(self.attrs.get('StoredVehicleDataResponseParsed')['0x030104000B'].get('value', 0))
-        if response == 3:
-            return True
-        else:
-            return False
+        return self._status.door_closed_right_back == 3
 
     @property
     def is_door_closed_right_back_supported(self):
         """Return true if window state is supported"""
-        response = 0
-        if self.attrs.get('StoredVehicleDataResponseParsed', False):
-            if '0x030104000B' in self.attrs.get('StoredVehicleDataResponseParsed'):
-                response = int(self.attrs.get('StoredVehicleDataResponseParsed')['0x030104000B'].get('value', 0))
-        return True if response != 0 else False
+        return True if self._status.door_closed_right_back else False
 
     @property
     def trunk_closed(self):
-        response = int(self.attrs.get('StoredVehicleDataResponseParsed')['0x030104000E'].get('value', 0))
-        if response == 3:
-            return True
-        else:
-            return False
+        return self._status.trunk_closed == 3
 
     @property
     def is_trunk_closed_supported(self):
         """Return true if window state is supported"""
-        response = 0
-        if self.attrs.get('StoredVehicleDataResponseParsed', False):
-            if '0x030104000E' in self.attrs.get('StoredVehicleDataResponseParsed'):
-                response = int(self.attrs.get('StoredVehicleDataResponseParsed')['0x030104000E'].get('value', 0))
-        return True if response != 0 else False
+        return True if self._status.trunk_closed else False
 
   # Departure timers
    # Under development
@@ -1975,8 +1904,8 @@ class Vehicle:
                 data = {}
                 timerdata = self.attrs.get('departuretimer', {}).get('timersAndProfiles', {}).get('timerList', {}).get('timer', [])
                 profiledata = self.attrs.get('departuretimer', {}).get('timersAndProfiles', {}).get('timerProfileList', {}).get('timerProfile', [])
-                timer = timerdata[0]
-                profile = profiledata[0]
+                timer = dict(timerdata[0])
+                profile = dict(profiledata[0])
                 timer.pop('timestamp', None)
                 timer.pop('timerID', None)
                 timer.pop('profileID', None)
@@ -1992,7 +1921,7 @@ class Vehicle:
             try:
                 response = self.attrs.get('timers', [])
                 if len(self.attrs.get('timers', [])) >= 1:
-                    timer = response[0]
+                    timer = dict(response[0])
                     timer.pop('id', None)
                 else:
                     timer = {}
@@ -2018,8 +1947,8 @@ class Vehicle:
                 data = {}
                 timerdata = self.attrs.get('departuretimer', {}).get('timersAndProfiles', {}).get('timerList', {}).get('timer', [])
                 profiledata = self.attrs.get('departuretimer', {}).get('timersAndProfiles', {}).get('timerProfileList', {}).get('timerProfile', [])
-                timer = timerdata[1]
-                profile = profiledata[1]
+                timer = dict(timerdata[1])
+                profile = dict(profiledata[1])
                 timer.pop('timestamp', None)
                 timer.pop('timerID', None)
                 timer.pop('profileID', None)
@@ -2035,7 +1964,7 @@ class Vehicle:
             try:
                 response = self.attrs.get('timers', [])
                 if len(self.attrs.get('timers', [])) >= 2:
-                    timer = response[1]
+                    timer = dict(response[1])
                     timer.pop('id', None)
                 else:
                     timer = {}
@@ -2061,8 +1990,8 @@ class Vehicle:
                 data = {}
                 timerdata = self.attrs.get('departuretimer', {}).get('timersAndProfiles', {}).get('timerList', {}).get('timer', [])
                 profiledata = self.attrs.get('departuretimer', {}).get('timersAndProfiles', {}).get('timerProfileList', {}).get('timerProfile', [])
-                timer = timerdata[2]
-                profile = profiledata[2]
+                timer = dict(timerdata[2])
+                profile = dict(profiledata[2])
                 timer.pop('timestamp', None)
                 timer.pop('timerID', None)
                 timer.pop('profileID', None)
@@ -2078,7 +2007,7 @@ class Vehicle:
             try:
                 response = self.attrs.get('timers', [])
                 if len(self.attrs.get('timers', [])) >= 3:
-                    timer = response[2]
+                    timer = dict(response[2])
                     timer.pop('id', None)
                 else:
                     timer = {}
@@ -0,0 +1,155 @@
+"""Tests of the Fleet update scheduler."""
+import asyncio
+
+import pytest
+
+import seatconnect.fleet as fleet
+from seatconnect.exceptions import SeatInvalidRequestException
+
+
+class FakeVehicle:
+    def __init__(self, account, vin):
+        self.account = account
+        self.vin = vin
+        self.updates = 0
+
+    async def update(self):
+        account = self.account
+        account.log.append(self.vin)
+        account.running += 1
+        account.stats['max_account'] = max(account.stats['max_account'], account.running)
+        account.stats['running'] += 1
+        account.stats['max_running'] = max(account.stats['max_running'], account.stats['running'])
+        await asyncio.sleep(account.duration)
+        account.running -= 1
+        account.stats['running'] -= 1
+        self.updates += 1
+        return True
+
+
+class FakeConnection:
+    """Connection with fake vehicles, vehicles are named by account, ie. a1, a2."""
+
+    vehicle_count = 3
+    duration = 0.01
+
+    def __init__(self, session, username, password, **optional):
+        self.username = username
+        self.log = []
+        self.running = 0
+        self.stats = FakeConnection.stats
+        self.vehicles = [FakeVehicle(self, f'{username}{number}') for number in range(1, self.vehicle_count + 1)]
+        self.closed = False
+        self.rate_limits = {}
+
+    async def doLogin(self):
+        return True
+
+    async def get_vehicles(self, update=True):
+        return self.vehicles
+
+    def vehicle(self, vin):
+        return next((vehicle for vehicle in self.vehicles if vehicle.vin == vin), None)
+
+    async def prepare_update(self):
+        pass
+
+    async def set_token(self, client):
+        pass
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def fake_connection(monkeypatch):
+    FakeConnection.stats = {'running': 0, 'max_running': 0, 'max_account': 0}
+    monkeypatch.setattr(fleet, 'Connection', FakeConnection)
+
+
+async def wait_for(condition, timeout=2):
+    loop = asyncio.get_running_loop()
+    end = loop.time() + timeout
+    while not condition():
+        assert loop.time() < end, 'Timed out'
+        await asyncio.sleep(0.005)
+
+
+def test_priority_order():
+    async def run():
+        scheduler = fleet.Fleet(None, concurrency=1)
+        account = await scheduler.add_account('a', 'password')
+        scheduler.schedule('a', 'a3', priority=0)
+        scheduler.start()
+        await wait_for(lambda: len(account.log) == 3)
+        await scheduler.stop()
+        return account.log
+
+    assert asyncio.run(run()) == ['a3', 'a1', 'a2']
+
+
+def test_account_concurrency():
+    async def run():
+        FakeConnection.vehicle_count = 6
+        try:
+            scheduler = fleet.Fleet(None, concurrency=10, account_concurrency=2)
+            accounts = [await scheduler.add_account(username, 'password') for username in ('a', 'b')]
+        finally:
+            FakeConnection.vehicle_count = 3
+        scheduler.start()
+        await wait_for(lambda: all(len(account.log) >= 6 for account in accounts))
+        await scheduler.stop()
+        return FakeConnection.stats
+
+    stats = asyncio.run(run())
+    assert stats['max_account'] == 2
+    assert stats['max_running'] == 4
+
+
+def test_reschedule_after_update():
+    async def run():
+        scheduler = fleet.Fleet(None, interval=0.02)
+        account = await scheduler.add_account('a', 'password')
+        scheduler.start()
+        await wait_for(lambda: all(vehicle.updates >= 3 for vehicle in account.vehicles))
+        metrics = scheduler.metrics
+        await scheduler.stop()
+        return account, metrics
+
+    account, metrics = asyncio.run(run())
+    assert metrics['failures'] == 0
+    assert metrics['scheduled'] + metrics['running'] == 3
+    assert account.closed
+
+
+def test_unknown_account():
+    async def run():
+        scheduler = fleet.Fleet(None)
+        scheduler.start()
+        with pytest.raises(SeatInvalidRequestException):
+            scheduler.schedule('nobody', 'VIN')
+        account = await scheduler.add_account('a', 'password')
+        await wait_for(lambda: len(account.log) == 3)
+        running = not scheduler._task.done()
+        await scheduler.stop()
+        return running
+
+    assert asyncio.run(run())
+
+
+def test_removed_account():
+    async def run():
+        scheduler = fleet.Fleet(None, interval=0.02)
+        account = await scheduler.add_account('a', 'password')
+        other = await scheduler.add_account('b', 'password')
+        scheduler.start()
+        await wait_for(lambda: len(account.log) >= 3)
+        scheduler.remove_account('a')
+        await wait_for(lambda: account.closed)
+        updates = len(account.log)
+        await wait_for(lambda: len(other.log) >= 9)
+        await scheduler.stop()
+        return updates, len(account.log)
+
+    before, after = asyncio.run(run())
+    assert before == after